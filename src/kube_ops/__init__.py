@@ -1,83 +1,114 @@
-from .api import KubeApi, CustomObjectDef, dict_to_labels
-from .common import (
-    env_from_configmap,
-    env_from_configmap_key_ref,
-    env_from_secret,
-    env_from_secret_key_ref,
-    env_from_field_ref,
-    empty_dir,
-    volume_from_configmap,
-    volume_from_secret,
-)
-from .config import Kubeconfig
-from .enums import (
-    ImagePullPolicy,
-    ServiceType,
-    SecretType,
-    PVCAccessMode,
-    IngressRulePathType,
-    MatchExprOperator,
-    VolumeModes,
-    DeploymentUpdateStrategy,
-    PodManagementPolicy,
-)
-from .manifests import (
-    ClusterRole,
-    ClusterRoleBinding,
-    ConfigMap,
-    CronJob,
-    Job,
-    Deployment,
-    Ingress,
-    Namespace,
-    Pod,
-    PersistentVolumeClaim,
-    Role,
-    RoleBinding,
-    StatefulSet,
-    Secret,
-    SecretImagePull,
-    SecretTLS,
-    Service,
-    ServiceAccount,
-    SecretServiceAccountToken,
-)
-from .templates import Container, LabelSelector
+import importlib
+import os
+import typing
 
-__all__ = [
-    "ClusterRole",
-    "ClusterRoleBinding",
-    "ConfigMap",
-    "Container",
-    "CronJob",
-    "CustomObjectDef",
-    "Deployment",
-    "Ingress",
-    "LabelSelector",
-    "Job",
+if typing.TYPE_CHECKING:
+    from .api import KubeApi, CustomObjectDef, dict_to_labels
+    from .common import (
+        env_from_configmap,
+        env_from_configmap_key_ref,
+        env_from_secret,
+        env_from_secret_key_ref,
+        env_from_field_ref,
+        empty_dir,
+        volume_from_configmap,
+        volume_from_secret,
+    )
+    from .config import Kubeconfig
+    from .enums import (
+        ImagePullPolicy,
+        ServiceType,
+        SecretType,
+        PVCAccessMode,
+        IngressRulePathType,
+        MatchExprOperator,
+        VolumeModes,
+        DeploymentUpdateStrategy,
+        PodManagementPolicy,
+        is_valid,
+    )
+    from .manifests import (
+        ClusterRole,
+        ClusterRoleBinding,
+        ConfigMap,
+        CronJob,
+        Job,
+        Deployment,
+        Ingress,
+        Namespace,
+        Pod,
+        PersistentVolumeClaim,
+        Role,
+        RoleBinding,
+        StatefulSet,
+        Secret,
+        SecretImagePull,
+        SecretTLS,
+        Service,
+        ServiceAccount,
+        SecretServiceAccountToken,
+    )
+    from .templates import Container, LabelSelector
+
+_LAZY_MAP = {
+    "KubeApi": ".api",
+    "CustomObjectDef": ".api",
+    "dict_to_labels": ".api",
+    "env_from_configmap": ".common",
+    "env_from_configmap_key_ref": ".common",
+    "env_from_secret": ".common",
+    "env_from_secret_key_ref": ".common",
+    "env_from_field_ref": ".common",
+    "empty_dir": ".common",
+    "volume_from_configmap": ".common",
+    "volume_from_secret": ".common",
+    "Kubeconfig": ".config",
+    "ImagePullPolicy": ".enums",
+    "ServiceType": ".enums",
+    "SecretType": ".enums",
+    "PVCAccessMode": ".enums",
+    "IngressRulePathType": ".enums",
+    "MatchExprOperator": ".enums",
+    "VolumeModes": ".enums",
+    "DeploymentUpdateStrategy": ".enums",
+    "PodManagementPolicy": ".enums",
+    "is_valid": ".enums",
+    "ClusterRole": ".manifests",
+    "ClusterRoleBinding": ".manifests",
+    "ConfigMap": ".manifests",
+    "CronJob": ".manifests",
+    "Job": ".manifests",
+    "Deployment": ".manifests",
+    "Ingress": ".manifests",
+    "Namespace": ".manifests",
+    "Pod": ".manifests",
+    "PersistentVolumeClaim": ".manifests",
+    "Role": ".manifests",
+    "RoleBinding": ".manifests",
+    "StatefulSet": ".manifests",
+    "Secret": ".manifests",
+    "SecretImagePull": ".manifests",
+    "SecretTLS": ".manifests",
+    "Service": ".manifests",
+    "ServiceAccount": ".manifests",
+    "SecretServiceAccountToken": ".manifests",
+    "Container": ".templates",
+    "LabelSelector": ".templates",
+}
+
+__all__ = (
     "KubeApi",
-    "Kubeconfig",
-    "Namespace",
-    "Pod",
-    "PersistentVolumeClaim",
-    "Role",
-    "RoleBinding",
-    "Secret",
-    "SecretImagePull",
-    "SecretTLS",
-    "Service",
-    "ServiceAccount",
-    "SecretServiceAccountToken",
-    "StatefulSet",
+    "CustomObjectDef",
+    "dict_to_labels",
     "env_from_configmap",
     "env_from_configmap_key_ref",
     "env_from_secret",
     "env_from_secret_key_ref",
     "env_from_field_ref",
     "empty_dir",
-    "dict_to_labels",
     "volume_from_configmap",
     "volume_from_secret",
+    "Kubeconfig",
     "ImagePullPolicy",
     "ServiceType",
     "SecretType",
@@ -87,4 +118,61 @@ __all__ = [
     "VolumeModes",
     "DeploymentUpdateStrategy",
     "PodManagementPolicy",
-]
+    "is_valid",
+    "ClusterRole",
+    "ClusterRoleBinding",
+    "ConfigMap",
+    "CronJob",
+    "Job",
+    "Deployment",
+    "Ingress",
+    "Namespace",
+    "Pod",
+    "PersistentVolumeClaim",
+    "Role",
+    "RoleBinding",
+    "StatefulSet",
+    "Secret",
+    "SecretImagePull",
+    "SecretTLS",
+    "Service",
+    "ServiceAccount",
+    "SecretServiceAccountToken",
+    "Container",
+    "LabelSelector",
+)
+
+_GROUPS: dict[str, list[str]] = {}
+for _name, _mod in _LAZY_MAP.items():
+    _GROUPS.setdefault(_mod, []).append(_name)
+
+
+def _load(mod: str) -> dict:
+    """
+    Import `mod` once and publish every name it re-exports.
+    """
+    m = importlib.import_module(mod, __name__)
+    names = {n: getattr(m, n) for n in _GROUPS[mod]}
+    globals().update(names)
+
+    return names
+
+
+def __getattr__(name: str):
+    """
+    Import the submodule that defines `name` on first access (PEP 562).
+    """
+    mod = _LAZY_MAP.get(name)
+    if mod is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    return _load(mod)[name]
+
+
+if os.getenv("KUBE_OPS_EAGER", "") not in ("", "0"):
+    for _mod in _GROUPS:
+        _load(_mod)
+
+
+def __dir__():
+    return sorted(__all__)
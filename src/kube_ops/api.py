@@ -1,15 +1,20 @@
 from __future__ import annotations
 
 import abc
-import base64
+import binascii
+import concurrent.futures
+import functools
+import json
 import logging
+import operator
 import os
+import sys
+import threading
 import time
 import typing
 from pathlib import Path
 
-import yaml
-from kubernetes import client, config as kube_config
+from kubernetes import client, config as kube_config, watch
 from kubernetes.client.rest import ApiException
 from kubernetes.config.incluster_config import (
     SERVICE_HOST_ENV_NAME,
@@ -18,6 +23,8 @@ from kubernetes.config.incluster_config import (
 )
 from kubernetes.stream import stream, ws_client
 
+from .cache import WatchCache
+
 
 class CustomObjectDef(typing.NamedTuple):
     """
@@ -36,14 +43,39 @@ class CustomObjectDef(typing.NamedTuple):
 
 
 def dict_to_labels(data: dict[str, str]) -> str:
-    return ",".join([f"{k}={v}" for k, v in data.items()])
+    return ",".join(f"{k}={v}" for k, v in data.items())
 
 
 def is_pod_ready(pod: client.V1Pod) -> bool:
-    statuses = pod.status.container_statuses or []
-    return not pod.metadata.deletion_timestamp and all(
-        map(lambda s: s.ready if s else False, statuses)
-    )
+    if pod.metadata.deletion_timestamp:
+        return False
+
+    return all(s and s.ready for s in pod.status.container_statuses or ())
+
+
+def _is_raw_pod_ready(pod: dict) -> bool:
+    """
+    `is_pod_ready` for a Pod decoded as plain JSON.
+    """
+    if pod["metadata"].get("deletionTimestamp"):
+        return False
+
+    statuses = (pod.get("status") or {}).get("containerStatuses")
+
+    return all(s and s.get("ready") for s in statuses or ())
+
+
+@functools.lru_cache(maxsize=None)
+def _default_namespace(config_file: str = None, context: str = None) -> str:
+    """
+    Namespace of the kubeconfig context. The kubeconfig is parsed
+    once per (file, context) for the process lifetime.
+    """
+    contexts, active = kube_config.list_kube_config_contexts(config_file)
+    if context:
+        active = next((c for c in contexts if c["name"] == context), active)
+
+    return active.get("context", {}).get("namespace", "default")
 
 
 class Writer:
@@ -51,10 +83,28 @@ class Writer:
     def write(self, data):
         pass
 
+    def flush(self):
+        pass
+
 
 class ResponseDataCollector(Writer, list):
+    """
+    Collects the stream chunks and splits them into lines once on `flush`.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._buf: list[str] = []
+
     def write(self, s: str):
-        super().extend(s.rstrip("\n").split("\n"))
+        self._buf.append(s)
+
+    def flush(self):
+        if not self._buf:
+            return
+
+        super().extend("".join(self._buf).rstrip("\n").split("\n"))
+        self._buf.clear()
 
 
 class Logger(Writer):
@@ -62,16 +112,27 @@ class Logger(Writer):
         self._log = log
 
     def write(self, data):
+        if isinstance(data, bytes):
+            data = data.decode("utf-8", "replace")
         self._log(data)
 
 
 class FileWriter(Writer):
+    """
+    Binary file sink with a 1 MiB write buffer.
+    """
+
     def __init__(self, file_path: Path, mode: str = "w"):
-        self._fd = file_path.open(mode=mode)
+        if "b" not in mode:
+            mode += "b"
+        self._fd = file_path.open(mode=mode, buffering=1 << 20)
 
     def write(self, data):
         self._fd.write(data)
 
+    def flush(self):
+        self._fd.flush()
+
     def close(self):
         self._fd.close()
 
@@ -82,9 +143,29 @@ class FileWriter(Writer):
         self.close()
 
 
+POOL_MAXSIZE = 32
+SCALE_WORKERS = 16
+SCALE_FIELD_MANAGER = "kube-py-scaler"
+# seconds a cached list waits for the initial list of a new watch cache
+CACHE_SYNC_TIMEOUT = 30
+# watch caches (one per resource, namespace and selector) kept per KubeApi,
+# the least recently used one is stopped beyond this
+WATCH_CACHE_MAXSIZE = 16
+LIST_PAGE_SIZE = 500
+# seconds an exec loop blocks on the websocket between buffer checks
+EXEC_POLL_TIMEOUT = 1
+
+_CACHE_SELECTORS = {"label_selector", "field_selector"}
+
+_STATUS_CODE = {"Running": 0, "Succeeded": 0, "Failed": 1}
+
+
 class PodStatus:
     def __init__(self, status: str):
-        self._status = status
+        # Interned, so comparisons against the phase literals below
+        # short-circuit on identity
+        self._status = sys.intern(status) if status is not None else None
+        self._code = _STATUS_CODE.get(status, 255)
 
     @property
     def status(self):
@@ -94,12 +175,7 @@ class PodStatus:
         exit(int(self))
 
     def __int__(self):
-        if self._status in ["Running", "Succeeded"]:
-            return 0
-        elif self._status in ["Failed"]:
-            return 1
-        else:
-            return 255
+        return self._code
 
     def __str__(self):
         return self.status
@@ -137,6 +213,250 @@ class JobStatus(PodStatus):
         super().__init__(s)
 
 
+class _Resource(typing.NamedTuple):
+    """
+    Table entry for the generated `<prefix>_create`, `<prefix>_delete`,
+    `<prefix>_get` and `<prefix>_list` methods of KubeApi.
+
+    Rows are written with keyword fields.
+
+    :example: _Resource(prefix="pod", api="core_v1", resource="pod",
+                        kind="Pod", arg="pod", cached=True)
+              resolves `core_v1.create_namespaced_pod` and so on.
+    """
+
+    prefix: str
+    api: str
+    resource: str
+    kind: str
+    # name of the object parameter of `<prefix>_create`
+    arg: str
+    namespaced: bool = True
+    # serve `<prefix>_list` from a WatchCache when KubeApi(cache=True)
+    cached: bool = False
+
+
+_RESOURCES = (
+    _Resource(
+        prefix="cluster_role",
+        api="rbac_authorization_v1_api",
+        resource="cluster_role",
+        kind="ClusterRole",
+        arg="cr",
+        namespaced=False,
+    ),
+    _Resource(
+        prefix="cluster_role_binding",
+        api="rbac_authorization_v1_api",
+        resource="cluster_role_binding",
+        kind="ClusterRoleBinding",
+        arg="crb",
+        namespaced=False,
+    ),
+    _Resource(
+        prefix="configmap",
+        api="core_v1",
+        resource="config_map",
+        kind="ConfigMap",
+        arg="cm",
+        cached=True,
+    ),
+    _Resource(
+        prefix="cron_job",
+        api="batch_v1",
+        resource="cron_job",
+        kind="CronJob",
+        arg="cronjob",
+    ),
+    _Resource(
+        prefix="job",
+        api="batch_v1",
+        resource="job",
+        kind="Job",
+        arg="job",
+    ),
+    _Resource(
+        prefix="deployment",
+        api="apps_v1",
+        resource="deployment",
+        kind="Deployment",
+        arg="deploy",
+        cached=True,
+    ),
+    _Resource(
+        prefix="ingress",
+        api="networking_v1",
+        resource="ingress",
+        kind="Ingress",
+        arg="ing",
+    ),
+    _Resource(
+        prefix="namespace",
+        api="core_v1",
+        resource="namespace",
+        kind="Namespace",
+        arg="ns",
+        namespaced=False,
+        cached=True,
+    ),
+    _Resource(
+        prefix="pod",
+        api="core_v1",
+        resource="pod",
+        kind="Pod",
+        arg="pod",
+        cached=True,
+    ),
+    _Resource(
+        prefix="pvc",
+        api="core_v1",
+        resource="persistent_volume_claim",
+        kind="PersistentVolumeClaim",
+        arg="pvc",
+    ),
+    _Resource(
+        prefix="role",
+        api="rbac_authorization_v1_api",
+        resource="role",
+        kind="Role",
+        arg="role",
+    ),
+    _Resource(
+        prefix="role_binding",
+        api="rbac_authorization_v1_api",
+        resource="role_binding",
+        kind="RoleBinding",
+        arg="rb",
+    ),
+    _Resource(
+        prefix="secret",
+        api="core_v1",
+        resource="secret",
+        kind="Secret",
+        arg="sec",
+        cached=True,
+    ),
+    _Resource(
+        prefix="service",
+        api="core_v1",
+        resource="service",
+        kind="Service",
+        arg="svc",
+    ),
+    _Resource(
+        prefix="service_account",
+        api="core_v1",
+        resource="service_account",
+        kind="ServiceAccount",
+        arg="sa",
+    ),
+    _Resource(
+        prefix="stateful_set",
+        api="apps_v1",
+        resource="stateful_set",
+        kind="StatefulSet",
+        arg="sts",
+        cached=True,
+    ),
+)
+
+
+_CREATE_TEMPLATE = """
+def create_factory(create_func, namespaced):
+    def create(self, {arg}, *, check_err=True, **kwargs):
+        return self._create(
+            create_func(self),
+            {arg},
+            check_err=check_err,
+            namespaced=namespaced,
+            **kwargs,
+        )
+
+    return create
+"""
+
+
+def _resource_methods(res: _Resource) -> dict[str, typing.Callable]:
+    """
+    Build the create/delete/get/list wrappers for a table entry.
+    """
+
+    namespaced = res.namespaced
+    cached = res.cached
+    scope = "namespaced_" if namespaced else ""
+    where = " in current namespace" if namespaced else ""
+    plural = res.kind + ("es" if res.kind.endswith("s") else "s")
+    model = f"client.V1{res.kind}"
+
+    # e.g. `self.core_v1.create_namespaced_pod`, resolved per call so the
+    # generated methods go through the cached API group properties
+    def api_func(verb: str):
+        return operator.attrgetter(f"{res.api}.{verb}_{scope}{res.resource}")
+
+    create_func = api_func("create")
+    delete_func = api_func("delete")
+    read_func = api_func("read")
+    list_func = api_func("list")
+
+    # a real `def`, so the object parameter keeps its per-resource name
+    # (e.g. `pod_create(pod, ...)`) and the interpreter binds the call
+    ns = {}
+    exec(_CREATE_TEMPLATE.format(arg=res.arg), ns)
+    create = ns["create_factory"](create_func, namespaced)
+    create.__annotations__.update({res.arg: model, "check_err": "bool"})
+
+    def delete(self, name: str, **kwargs):
+        return self._delete(
+            delete_func(self), name, namespaced=namespaced, **kwargs
+        )
+
+    def get(self, name: str, *, check_err: bool = True, **kwargs):
+        return self._get(
+            read_func(self), name, check_err, namespaced=namespaced, **kwargs
+        )
+
+    def list_(self, **kwargs):
+        return self._list(
+            list_func(self), namespaced=namespaced, cached=cached, **kwargs
+        )
+
+    create.__doc__ = f"Create {res.kind}{where}."
+    delete.__doc__ = f"Delete {res.kind} by name{where}."
+    get.__doc__ = f"Get {res.kind} by name{where}."
+    list_.__doc__ = f"List all {plural}{where}."
+
+    create.__annotations__["return"] = model
+    delete.__annotations__["return"] = f"{model} | None"
+    get.__annotations__["return"] = f"{model} | None"
+    list_.__annotations__["return"] = f"{model}List"
+
+    return {
+        f"{res.prefix}_create": create,
+        f"{res.prefix}_delete": delete,
+        f"{res.prefix}_get": get,
+        f"{res.prefix}_list": list_,
+    }
+
+
+def _with_resources(cls):
+    """
+    Install the generated methods of `_RESOURCES` into `cls`.
+    Methods defined explicitly in the class body take precedence.
+    """
+
+    for res in _RESOURCES:
+        for name, method in _resource_methods(res).items():
+            if name in cls.__dict__:
+                continue
+
+            method.__name__ = name
+            method.__qualname__ = f"{cls.__qualname__}.{name}"
+            setattr(cls, name, method)
+
+    return cls
+
+
+@_with_resources
 class KubeApi:
     def __init__(
         self,
@@ -144,14 +464,24 @@ class KubeApi:
         conf: client.Configuration = None,
         config_file: str = None,
         context: str = None,
+        cache: bool = False,
     ):
+        """
+        :param cache: Serve `configmap_get`, `secret_get`, `namespace_get`
+                      and the ConfigMap, Secret, Namespace, Deployment,
+                      StatefulSet and Pod lists from watch-backed in-memory
+                      caches. Cached objects are shared and must not be
+                      modified. At most WATCH_CACHE_MAXSIZE caches are
+                      kept, the least recently used one is stopped.
+        """
 
         self._ns = None
-        self._api_client = None
+        self._cache = cache
+        self._watch_caches: dict[tuple, WatchCache] = {}
+        self._watch_caches_lock = threading.Lock()
 
         if conf:
             client.Configuration().set_default(conf)
-            self._api_client = client.ApiClient(conf)
         else:
             if self.is_use_in_cluster():
                 kube_config.load_incluster_config()
@@ -164,14 +494,24 @@ class KubeApi:
             else:
                 kube_config.load_kube_config(config_file, context, conf)
 
+        if conf is None:
+            conf = client.Configuration.get_default_copy()
+        # Keep enough keep-alive connections for concurrent requests
+        conf.connection_pool_maxsize = max(
+            POOL_MAXSIZE, conf.connection_pool_maxsize
+        )
+
+        # One ApiClient (and so one urllib3 pool) shared by every *Api object,
+        # its thread pool serves `async_req` requests (e.g. `*_get_many`)
+        self._api_client = client.ApiClient(
+            conf, pool_threads=conf.connection_pool_maxsize
+        )
+
         if namespace:
             self._ns = namespace
         else:
             if self._ns is None:
-                _, curr_ctx = kube_config.list_kube_config_contexts()
-                self._ns = curr_ctx.get("context", {}).get(
-                    "namespace", "default"
-                )
+                self._ns = _default_namespace(config_file, context)
 
     @property
     def current_namespace(self) -> str:
@@ -204,28 +544,68 @@ class KubeApi:
     @staticmethod
     def from_file(): ...
 
-    @property
-    def apps_v1(self):
+    def close(self):
+        """
+        Stop the watch caches and release the connection pool
+        and thread pools of the ApiClients.
+        """
+        for c in self._watch_caches.values():
+            c.stop()
+
+        for name in ("_apply_apps_v1", "_stream_core_v1"):
+            api = self.__dict__.get(name)
+            if api is not None:
+                api.api_client.close()
+
+        self._api_client.rest_client.pool_manager.clear()
+        self._api_client.close()
+
+    @functools.cached_property
+    def apps_v1(self) -> client.AppsV1Api:
         return client.AppsV1Api(self._api_client)
 
-    @property
-    def batch_v1(self):
+    @functools.cached_property
+    def _apply_apps_v1(self) -> client.AppsV1Api:
+        # The generated API has no per-call Content-Type, a default header
+        # turns every PATCH of this client into a server-side apply.
+        # It reuses the rest client, so the connection pool is shared.
+        api_client = client.ApiClient(self._api_client.configuration)
+        api_client.rest_client = self._api_client.rest_client
+        api_client.set_default_header(
+            "Content-Type", "application/apply-patch+yaml"
+        )
+
+        return client.AppsV1Api(api_client)
+
+    @functools.cached_property
+    def _stream_core_v1(self) -> client.CoreV1Api:
+        # `stream` swaps ApiClient.request for the websocket transport while
+        # it runs, so exec calls get a dedicated client to keep the shared
+        # one intact. It is only used through `stream`, so concurrent swaps
+        # always install the same transport.
+        api_client = client.ApiClient(self._api_client.configuration)
+        api_client.rest_client = self._api_client.rest_client
+
+        return client.CoreV1Api(api_client)
+
+    @functools.cached_property
+    def batch_v1(self) -> client.BatchV1Api:
         return client.BatchV1Api(self._api_client)
 
-    @property
-    def core_v1(self):
+    @functools.cached_property
+    def core_v1(self) -> client.CoreV1Api:
         return client.CoreV1Api(self._api_client)
 
-    @property
-    def custom_object_api(self):
+    @functools.cached_property
+    def custom_object_api(self) -> client.CustomObjectsApi:
         return client.CustomObjectsApi(self._api_client)
 
-    @property
-    def networking_v1(self):
+    @functools.cached_property
+    def networking_v1(self) -> client.NetworkingV1Api:
         return client.NetworkingV1Api(self._api_client)
 
-    @property
-    def rbac_authorization_v1_api(self):
+    @functools.cached_property
+    def rbac_authorization_v1_api(self) -> client.RbacAuthorizationV1Api:
         return client.RbacAuthorizationV1Api(self._api_client)
 
     @staticmethod
@@ -267,6 +647,7 @@ class KubeApi:
         tail_lines: int = None,
         follow: bool = True,
         namespace: str = None,
+        output: typing.BinaryIO = None,
     ):
         """
         Read logs from container.
@@ -276,21 +657,33 @@ class KubeApi:
         :param tail_lines: Lines of recent log file to display.
         :param follow: Specify if the logs should be streamed.
         :param namespace: Specific namespace.
+        :param output: Binary sink (e.g. `sys.stdout.buffer`) the raw log
+                       stream is copied to. If not set, every received
+                       chunk is sent to `logging.info`.
         """
 
         ns = self._ns
         if namespace:
             ns = namespace
 
-        for line in self.core_v1.read_namespaced_pod_log(
+        resp = self.core_v1.read_namespaced_pod_log(
             pod_name,
             ns,
             container=container,
             follow=follow,
             _preload_content=False,
             tail_lines=tail_lines,
-        ).stream():
-            logging.info(line.decode().rstrip("\n"))
+        )
+        try:
+            if output is not None:
+                for chunk in resp.stream(1 << 16):
+                    output.write(chunk)
+                return
+
+            for line in resp.stream():
+                logging.info(line.decode().rstrip("\n"))
+        finally:
+            resp.release_conn()
 
     def copy_file_from_pod(
         self, name: str, remote_path: str, local_path: Path, **kwargs
@@ -311,7 +704,9 @@ class KubeApi:
         logging.info(local_path)
         f = FileWriter(local_path)
         try:
-            self._exec(name, cmd, f, Logger(logging.error), **kwargs)
+            self._exec(
+                name, cmd, f, Logger(logging.error), binary=True, **kwargs
+            )
         except Exception:
             raise
         finally:
@@ -347,12 +742,10 @@ class KubeApi:
         if not sec:
             return
 
-        return dict(
-            map(
-                lambda item: (item[0], base64.b64decode(item[1]).decode()),
-                sec.data.items(),
-            )
-        )
+        return {
+            k: binascii.a2b_base64(v).decode("utf-8")
+            for k, v in (sec.data or {}).items()
+        }
 
     def _create(self, func, obj, check_err: bool, **kwargs):
         """
@@ -375,7 +768,8 @@ class KubeApi:
             resp = (
                 func(ns, obj, **kwargs) if namespaced else func(obj, **kwargs)
             )
-            logging.debug("Kubernetes API Response: %s", resp)
+            if logging.root.isEnabledFor(logging.DEBUG):
+                logging.debug("Kubernetes API Response: %s", resp)
 
             return resp
         except ApiException as e:
@@ -421,20 +815,31 @@ class KubeApi:
 
         ns = kwargs.pop("namespace", self._ns)
         r = stream(
-            self.core_v1.connect_post_namespaced_pod_exec,
+            self._stream_core_v1.connect_post_namespaced_pod_exec,
             pod_name,
             ns,
             **kwargs,
         )
         while r.is_open():
-            r.update(timeout=1)
-            if r.peek_stdout():
-                stdout.write(r.read_stdout())
-            if r.peek_stderr():
-                stderr.write(r.read_stderr())
+            # `update` reads at most one frame and a `read_*` of an empty
+            # channel polls once more, which may buffer the next frame, so
+            # block only when nothing is buffered. The fd poll of `update`
+            # can not see frames already decrypted into the SSL buffer,
+            # the short tick bounds how long those wait.
+            if not (r.peek_stdout() or r.peek_stderr()):
+                r.update(timeout=EXEC_POLL_TIMEOUT)
+            data = r.read_stdout(timeout=0)
+            if data:
+                stdout.write(data)
+            data = r.read_stderr(timeout=0)
+            if data:
+                stderr.write(data)
+
+        stdout.flush()
+        stderr.flush()
 
         e = r.read_channel(ws_client.ERROR_CHANNEL)
-        err = yaml.safe_load(e)
+        err = json.loads(e) if e else {"status": "Success"}
         r.close()
 
         if _preload_content:
@@ -493,7 +898,8 @@ class KubeApi:
                     args.append(ns)
 
             resp = func(*args, **kwargs)
-            logging.debug("Kubernetes API Response: %s", resp)
+            if logging.root.isEnabledFor(logging.DEBUG):
+                logging.debug("Kubernetes API Response: %s", resp)
 
             return resp
         except ApiException as e:
@@ -506,219 +912,250 @@ class KubeApi:
 
             logging.error(e)
 
-    def _list(self, func, **kwargs):
-        ns = kwargs.pop("namespace", self._ns)
+    def _get_many(
+        self, func, names: list[str], check_err: bool, **kwargs
+    ) -> list:
+        """
+        The wrapper function used for concurrent Kubernetes API GET requests.
 
-        return func(ns, **kwargs)
+        All requests are submitted at once to the thread pool of the shared
+        ApiClient (`async_req=True`), so the total latency is that of the
+        slowest request rather than the sum of all of them.
 
-    def _scale(self, func, name: str, replicas: int, wait: bool, **kwargs):
-        """
-        Scale down wrapper.
+        :param func: Function for wrapping.
+        :param names: Names of Kubernetes resources.
+        :param check_err: Enable or disable throwing an exception
+                          if an error occurs.
+        :param timeout: Seconds to wait for each response.
+        :param kwargs: See all parameters in wrapped function.
+
+        :return: Objects in the order of `names`, None for resources
+                 which are not found.
         """
-        kwargs["body"] = {"spec": {"replicas": replicas}}
-        resp = self._get(func, name, check_err=True, **kwargs)
-        msg = f"{resp.kind.lower()}.apps/{name} scaled to {replicas} replicas"
-        logging.info(msg)
 
-        if wait:
-            labels = dict_to_labels(resp.spec.template.metadata.labels)
-            self.wait_pods(labels, msg)
+        timeout = kwargs.pop("timeout", None)
+        ns = kwargs.pop("namespace", self._ns)
+        reqs = [func(name, ns, async_req=True, **kwargs) for name in names]
 
-        return resp
+        result = []
+        for r in reqs:
+            try:
+                result.append(r.get(timeout))
+            except ApiException as e:
+                result.append(None)
+                if e.status == 404:
+                    logging.debug(e)
+                    continue
 
-    def cluster_role_create(
-        self, cr: client.V1ClusterRole, *, check_err: bool = True, **kwargs
-    ) -> client.V1ClusterRole:
-        """
-        Create ClusterRole.
-        """
+                if check_err:
+                    raise
 
-        return self._create(
-            self.rbac_authorization_v1_api.create_cluster_role,
-            cr,
-            check_err=check_err,
-            namespaced=False,
-            **kwargs,
-        )
+                logging.error(e)
 
-    def cluster_role_delete(
-        self, name: str, **kwargs
-    ) -> client.V1ClusterRole | None:
+        return result
+
+    def _watch_cache(self, list_func, args: tuple, kwargs: dict):
         """
-        Delete ClusterRole by name.
+        Get or start the watch cache of `list_func` for the given
+        request parameters.
+
+        The caches are kept in least recently used order, a new one
+        beyond WATCH_CACHE_MAXSIZE stops and drops the oldest.
         """
 
-        return self._delete(
-            self.rbac_authorization_v1_api.delete_cluster_role,
-            name,
-            namespaced=False,
-            **kwargs,
-        )
+        key = (list_func.__name__, *args, *sorted(kwargs.items()))
+        with self._watch_caches_lock:
+            c = self._watch_caches.pop(key, None)
+            if c is None:
+                c = WatchCache(list_func, *args, **kwargs)
+            self._watch_caches[key] = c
 
-    def cluster_role_get(
-        self, name: str, *, check_err: bool = True, **kwargs
-    ) -> client.V1ClusterRole | None:
-        """
-        Get ClusterRole.
-        """
+            while len(self._watch_caches) > WATCH_CACHE_MAXSIZE:
+                oldest = next(iter(self._watch_caches))
+                self._watch_caches.pop(oldest).stop()
 
-        return self._get(
-            self.rbac_authorization_v1_api.read_cluster_role,
-            name,
-            check_err,
-            namespaced=False,
-            **kwargs,
-        )
+        return c
 
-    def cluster_role_list(self, **kwargs) -> client.V1ClusterRoleList:
-        """
-        List all ClusterRoles.
+    def _from_cache(
+        self, list_func, name: str, kwargs: dict, namespaced: bool = True
+    ):
         """
+        Look up an object in the watch cache of `list_func`.
 
-        return self.rbac_authorization_v1_api.list_cluster_role(**kwargs)
+        Only plain lookups by name are served from the cache, any extra
+        request parameter bypasses it.
 
-    def cluster_role_binding_create(
-        self,
-        crb: client.V1ClusterRoleBinding,
-        *,
-        check_err: bool = True,
-        **kwargs,
-    ) -> client.V1ClusterRoleBinding:
-        """
-        Create ClusterRoleBinding.
+        :return: Cached object or None on a cache miss.
         """
 
-        return self._create(
-            self.rbac_authorization_v1_api.create_cluster_role_binding,
-            crb,
-            check_err=check_err,
-            namespaced=False,
-            **kwargs,
-        )
+        if not self._cache or set(kwargs) - {"namespace"}:
+            return
 
-    def cluster_role_binding_delete(
-        self, name: str, **kwargs
-    ) -> client.V1ClusterRoleBinding | None:
-        """
-        Delete ClusterRoleBinding by name.
-        """
+        args = (kwargs.get("namespace") or self._ns,) if namespaced else ()
 
-        return self._delete(
-            self.rbac_authorization_v1_api.delete_cluster_role_binding,
-            name,
-            namespaced=False,
-            **kwargs,
-        )
+        return self._watch_cache(list_func, args, {}).get(name)
 
-    def cluster_role_binding_get(
-        self, name: str, *, check_err: bool = True, **kwargs
-    ) -> client.V1ClusterRoleBinding | None:
-        """
-        Get ClusterRoleBinding.
+    def _cached_list(self, list_func, args: tuple, kwargs: dict):
         """
+        Get a list snapshot from the watch cache of `list_func`.
 
-        return self._get(
-            self.rbac_authorization_v1_api.read_cluster_role_binding,
-            name,
-            check_err,
-            namespaced=False,
-            **kwargs,
-        )
+        Every distinct label/field selector gets its own cache, any other
+        request parameter bypasses it.
 
-    def cluster_role_binding_list(
-        self, **kwargs
-    ) -> client.V1ClusterRoleBindingList:
-        """
-        List all ClusterRoleBindings.
+        :return: List object or None if it can not be served from cache.
         """
 
-        return self.rbac_authorization_v1_api.list_cluster_role_binding(
-            **kwargs
-        )
+        if not self._cache or set(kwargs) - _CACHE_SELECTORS:
+            return
 
-    def configmap_create(
-        self, cm: client.V1ConfigMap, *, check_err: bool = True, **kwargs
-    ) -> client.V1ConfigMap:
-        """
-        Create ConfigMap in current namespace.
-        """
+        c = self._watch_cache(list_func, args, kwargs)
 
-        return self._create(
-            self.core_v1.create_namespaced_config_map,
-            cm,
-            check_err=check_err,
-            **kwargs,
-        )
+        return c.snapshot(CACHE_SYNC_TIMEOUT)
 
-    def configmap_delete(
-        self, name: str, **kwargs
-    ) -> client.V1ConfigMap | None:
-        """
-        Delete ConfigMap by name in current namespace.
+    def _list(self, func, *args, **kwargs):
         """
+        The wrapper function used for the Kubernetes API list requests.
 
-        return self._delete(
-            self.core_v1.delete_namespaced_config_map, name, **kwargs
-        )
+        Lists are served from the API server watch cache
+        (`resourceVersion=0`) instead of a quorum read from etcd, so the
+        result may be slightly stale. Pass `consistent=True` (or an explicit
+        `resource_version`) when the latest state is required.
 
-    def configmap_get(
-        self, name: str, *, check_err: bool = True, **kwargs
-    ) -> client.V1ConfigMap | None:
-        """
-        Get ConfigMap by name in current namespace.
+        :param func: Function for wrapping.
+        :param args: Positional arguments placed before the namespace.
+        :param namespaced: Switch wrapper for non-namespaced API request.
+        :param consistent: Read the latest state from etcd.
+        :param cached: Serve the list from the watch cache
+                       if KubeApi caching is enabled.
+        :param kwargs: See all parameters in wrapped function.
         """
 
-        return self._get(
-            self.core_v1.read_namespaced_config_map, name, check_err, **kwargs
-        )
+        cached = kwargs.pop("cached", False)
+        if kwargs.pop("namespaced", True):
+            args = (*args, kwargs.pop("namespace", self._ns))
 
-    def configmap_list(self, **kwargs) -> client.V1ConfigMapList:
+        if not kwargs.pop("consistent", False):
+            if cached:
+                resp = self._cached_list(func, args, kwargs)
+                if resp is not None:
+                    return resp
+
+            kwargs.setdefault("resource_version", "0")
+
+        return func(*args, **kwargs)
+
+    def _iter_list(
+        self,
+        func,
+        *args,
+        limit: int = LIST_PAGE_SIZE,
+        raw: bool = False,
+        **kwargs,
+    ):
         """
-        List all ConfigMaps in current namespace.
+        Iterate over the items of a list request fetched in pages of
+        `limit` objects, following the `continue` token.
+
+        Only one page is held in memory at a time. The API server ignores
+        `limit` for `resourceVersion=0`, so without an explicit
+        `resource_version` the pages are read from etcd instead of the
+        watch cache default of `_list`.
+
+        :param func: Function for wrapping.
+        :param limit: Page size.
+        :param raw: Yield items as decoded JSON instead of models.
+        :param kwargs: See `_list`.
         """
 
-        return self._list(self.core_v1.list_namespaced_config_map, **kwargs)
+        kwargs["limit"] = limit
+        if "resource_version" not in kwargs:
+            kwargs["consistent"] = True
+        if raw:
+            kwargs["_preload_content"] = False
+
+        while 1:
+            resp = self._list(func, *args, **kwargs)
+            if raw:
+                data = json.loads(resp.data)
+                yield from data["items"] or ()
+                token = data["metadata"].get("continue")
+            else:
+                yield from resp.items
+                token = resp.metadata._continue
+
+            if not token:
+                return
+
+            # the token pins the resource version of the first page
+            kwargs.pop("resource_version", None)
+            kwargs["consistent"] = True
+            kwargs["_continue"] = token
 
-    def cron_job_create(
-        self, cronjob: client.V1CronJob, *, check_err: bool = True, **kwargs
-    ) -> client.V1CronJob:
+    def _replicated(self, list_func):
         """
-        Create CronJob in current namespace.
+        Names of the objects of `list_func` with non-zero replicas.
+
+        The list is decoded as plain JSON: only `metadata.name` and
+        `spec.replicas` are read, so the full models are never built.
         """
 
-        return self._create(
-            self.batch_v1.create_namespaced_cron_job,
-            cronjob,
-            check_err=check_err,
-            **kwargs,
-        )
+        for i in self._iter_list(list_func, raw=True):
+            if i["spec"].get("replicas"):
+                yield i["metadata"]["name"]
 
-    def cron_job_delete(self, name: str, **kwargs) -> client.V1CronJob | None:
-        """
-        Delete CronJob by name in current namespace.
+    def _scale(
+        self, func, kind: str, name: str, replicas: int, wait: bool, **kwargs
+    ):
         """
+        Scale down wrapper.
 
-        return self._delete(
-            self.batch_v1.delete_namespaced_cron_job, name, **kwargs
-        )
+        The replicas are set with a server-side apply owned by
+        SCALE_FIELD_MANAGER, so there is no read-modify-write round-trip.
+        """
+        kwargs["body"] = {
+            "apiVersion": "apps/v1",
+            "kind": kind,
+            "metadata": {"name": name},
+            "spec": {"replicas": replicas},
+        }
+        kwargs.setdefault("field_manager", SCALE_FIELD_MANAGER)
+        kwargs.setdefault("force", True)
+        resp = self._get(func, name, check_err=True, **kwargs)
+        msg = f"{resp.kind.lower()}.apps/{name} scaled to {replicas} replicas"
+        logging.info(msg)
+
+        if wait:
+            self.wait_pods(resp.spec.template.metadata.labels, msg)
 
-    def cron_job_get(
+        return resp
+
+    def configmap_get(
         self, name: str, *, check_err: bool = True, **kwargs
-    ) -> client.V1CronJob | None:
+    ) -> client.V1ConfigMap | None:
         """
-        Get CronJob by name in current namespace.
+        Get ConfigMap by name in current namespace.
         """
 
+        cm = self._from_cache(
+            self.core_v1.list_namespaced_config_map, name, kwargs
+        )
+        if cm is not None:
+            return cm
+
         return self._get(
-            self.batch_v1.read_namespaced_cron_job, name, check_err, **kwargs
+            self.core_v1.read_namespaced_config_map, name, check_err, **kwargs
         )
 
-    def cron_job_list(self, **kwargs) -> client.V1CronJobList:
+    def configmap_get_many(
+        self, names: list[str], *, check_err: bool = True, **kwargs
+    ) -> list[client.V1ConfigMap | None]:
         """
-        List all CronJobs in current namespace.
+        Get ConfigMaps by names in current namespace concurrently.
         """
 
-        return self._list(self.batch_v1.list_namespaced_cron_job, **kwargs)
+        return self._get_many(
+            self.core_v1.read_namespaced_config_map, names, check_err, **kwargs
+        )
 
     def custom_object_create(
         self,
@@ -807,172 +1244,47 @@ class KubeApi:
             args.insert(2, ns)
             func = self.custom_object_api.list_namespaced_custom_object
 
-        return func(*args, **kwargs)
+        return self._list(func, *args, namespaced=False, **kwargs)
 
-    def job_create(
-        self, job: client.V1Job, *, check_err: bool = True, **kwargs
-    ) -> client.V1Job:
+    def ingress_delete(
+        self, name: str, *, check_err: bool = True, **kwargs
+    ) -> client.V1Ingress | None:
         """
-        Create Job in current namespace.
+        Delete Ingress by name in current namespace.
         """
 
-        return self._create(
-            self.batch_v1.create_namespaced_job,
-            job,
+        return self._delete(
+            self.networking_v1.delete_namespaced_ingress,
+            name,
             check_err=check_err,
             **kwargs,
         )
 
-    def job_delete(self, name: str, **kwargs) -> client.V1Job | None:
+    def namespace_create(
+        self, ns: client.V1Namespace, *, check_err: bool = False, **kwargs
+    ) -> client.V1Namespace:
         """
-        Delete Job by name in current namespace.
+        Create Namespace.
         """
 
-        return self._delete(
-            self.batch_v1.delete_namespaced_job, name, **kwargs
+        return self._create(
+            self.core_v1.create_namespace,
+            ns,
+            check_err,
+            namespaced=False,
+            **kwargs,
         )
 
-    def job_get(
-        self, name: str, *, check_err: bool = True, **kwargs
-    ) -> client.V1Job | None:
+    def namespace_get(self, name: str, **kwargs) -> client.V1Namespace | None:
         """
-        Get Job by name in current namespace.
-        """
-        return self._get(
-            self.batch_v1.read_namespaced_job, name, check_err, **kwargs
-        )
-
-    def job_list(self, **kwargs) -> client.V1JobList:
-        """
-        List all Jobs in current namespace.
-        """
-
-        return self._list(self.batch_v1.list_namespaced_job, **kwargs)
-
-    def deployment_create(
-        self, deploy: client.V1Deployment, *, check_err: bool = True, **kwargs
-    ) -> client.V1Deployment | None:
-        """
-        Create Deployment in current namespace.
-        """
-
-        return self._create(
-            self.apps_v1.create_namespaced_deployment,
-            deploy,
-            check_err=check_err,
-            **kwargs,
-        )
-
-    def deployment_delete(
-        self, name: str, **kwargs
-    ) -> client.V1Deployment | None:
-        """
-        Delete Deployment in current namespace
-        """
-
-        return self._delete(
-            self.apps_v1.delete_namespaced_deployment, name, **kwargs
-        )
-
-    def deployment_get(
-        self, name: str, *, check_err: bool = True, **kwargs
-    ) -> client.V1Deployment | None:
-        """
-        Get Deployment by name in current namespace.
-        """
-
-        return self._get(
-            self.apps_v1.read_namespaced_deployment, name, check_err, **kwargs
-        )
-
-    def deployment_list(self, **kwargs) -> client.V1DeploymentList:
-        """
-        List all Deployments in current namespace.
-        """
-
-        return self._list(self.apps_v1.list_namespaced_deployment, **kwargs)
-
-    def ingress_create(
-        self, ing: client.V1Ingress, *, check_err: bool = True, **kwargs
-    ) -> client.V1Ingress:
-        """
-        Get Ingres by name in current namespace.
-        """
-
-        return self._create(
-            self.networking_v1.create_namespaced_ingress,
-            ing,
-            check_err,
-            **kwargs,
-        )
-
-    def ingress_delete(
-        self, name: str, *, check_err: bool = True, **kwargs
-    ) -> client.V1Ingress | None:
-        """
-        Get Ingresses by name in current namespace.
+        Get Namespace by name.
         """
 
-        return self._get(
-            self.networking_v1.delete_namespaced_ingress,
-            name,
-            check_err,
-            **kwargs,
+        ns = self._from_cache(
+            self.core_v1.list_namespace, name, kwargs, namespaced=False
         )
-
-    def ingress_get(
-        self, name: str, *, check_err: bool = True, **kwargs
-    ) -> client.V1Ingress | None:
-        """
-        Get Ingresses by name in current namespace.
-        """
-
-        return self._get(
-            self.networking_v1.read_namespaced_ingress,
-            name,
-            check_err,
-            **kwargs,
-        )
-
-    def ingress_list(self, **kwargs) -> client.V1IngressList:
-        """
-        List all Ingresses in current namespace.
-        """
-
-        return self._list(
-            self.networking_v1.list_namespaced_ingress, **kwargs
-        )
-
-    def namespace_create(
-        self, ns: client.V1Namespace, *, check_err: bool = False, **kwargs
-    ) -> client.V1Namespace:
-        """
-        Create Namespace.
-        """
-
-        return self._create(
-            self.core_v1.create_namespace,
-            ns,
-            check_err,
-            namespaced=False,
-            **kwargs,
-        )
-
-    def namespace_delete(
-        self, name: str, **kwargs
-    ) -> client.V1Namespace | None:
-        """
-        Delete Namespace by name.
-        """
-
-        return self._delete(
-            self.core_v1.delete_namespace, name, namespaced=False, **kwargs
-        )
-
-    def namespace_get(self, name: str, **kwargs) -> client.V1Namespace | None:
-        """
-        Get Namespace by name.
-        """
+        if ns is not None:
+            return ns
 
         return self._get(
             self.core_v1.read_namespace,
@@ -982,206 +1294,15 @@ class KubeApi:
             **kwargs,
         )
 
-    def namespace_list(self, **kwargs) -> client.V1NamespaceList:
-        """
-        List all Namespaces.
-        """
-
-        return self.core_v1.list_namespace(**kwargs)
-
-    def pod_create(
-        self, pod: client.V1Pod, *, check_err: bool = True, **kwargs
-    ) -> client.V1Pod:
-        """
-        Create Pod in current namespace.
-        """
-
-        return self._create(
-            self.core_v1.create_namespaced_pod,
-            pod,
-            check_err=check_err,
-            **kwargs,
-        )
-
-    def pod_delete(self, name: str, **kwargs) -> client.V1Pod | None:
-        """
-        Delete Pod by name in current namespace.
-        """
-
-        return self._delete(
-            self.core_v1.delete_namespaced_pod, name, **kwargs
-        )
-
-    def pod_get(
-        self, name: str, *, check_err: bool = True, **kwargs
-    ) -> client.V1Pod | None:
-        """
-        Get Pod by name in current namespace.
-        """
-
-        return self._get(
-            self.core_v1.read_namespaced_pod, name, check_err, **kwargs
-        )
-
-    def pod_list(self, **kwargs) -> client.V1PodList:
-        """
-        List all Pods in current namespace.
-        """
-
-        return self._list(self.core_v1.list_namespaced_pod, **kwargs)
-
-    def pvc_create(
-        self,
-        pvc: client.V1PersistentVolumeClaim,
-        *,
-        check_err: bool = True,
-        **kwargs,
-    ) -> client.V1PersistentVolumeClaim:
-        """
-        Create PersistentVolumeClaim in current namespace.
-        """
-
-        return self._create(
-            self.core_v1.create_namespaced_persistent_volume_claim,
-            pvc,
-            check_err=check_err,
-            **kwargs,
-        )
-
-    def pvc_delete(
-        self, name: str, **kwargs
-    ) -> client.V1PersistentVolumeClaim | None:
-        """
-        Delete PersistentVolumeClaim by name in current namespace.
-        """
-
-        return self._delete(
-            self.core_v1.delete_namespaced_persistent_volume_claim,
-            name,
-            **kwargs,
-        )
-
-    def pvc_get(
-        self, name: str, *, check_err: bool = True, **kwargs
-    ) -> client.V1PersistentVolumeClaim | None:
-        """
-        Get PersistentVolumeClaim by name in current namespace.
-        """
-
-        return self._get(
-            self.core_v1.read_namespaced_persistent_volume_claim,
-            name,
-            check_err,
-            **kwargs,
-        )
-
-    def pvc_list(self, **kwargs) -> client.V1PersistentVolumeClaimList:
-        """
-        List all PersistentVolumeClaims in current namespace.
-        """
-
-        return self._list(
-            self.core_v1.list_namespaced_persistent_volume_claim, **kwargs
-        )
-
-    def role_create(
-        self, role: client.V1Role, *, check_err: bool = True, **kwargs
-    ) -> client.V1Role:
-        """
-        Create RoleBinding.
-        """
-
-        return self._create(
-            self.rbac_authorization_v1_api.create_namespaced_role,
-            role,
-            check_err=check_err,
-            namespaced=False,
-            **kwargs,
-        )
-
-    def role_delete(self, name: str, **kwargs) -> client.V1Role | None:
-        """
-        Delete Role by name.
-        """
-
-        return self._delete(
-            self.rbac_authorization_v1_api.delete_namespaced_role,
-            name,
-            **kwargs,
-        )
-
-    def role_get(
-        self, name: str, *, check_err: bool = True, **kwargs
-    ) -> client.V1Role | None:
-        """
-        Get RoleBinding.
-        """
-
-        return self._get(
-            self.rbac_authorization_v1_api.read_namespaced_role,
-            name,
-            check_err,
-            **kwargs,
-        )
-
-    def role_list(self, **kwargs) -> client.V1RoleList:
-        """
-        List all RoleBindings.
-        """
-
-        return self._list(
-            self.rbac_authorization_v1_api.list_namespaced_role, **kwargs
-        )
-
-    def role_binding_create(
-        self, rb: client.V1RoleBinding, *, check_err: bool = True, **kwargs
-    ) -> client.V1RoleBinding:
-        """
-        Create RoleBinding.
-        """
-
-        return self._create(
-            self.rbac_authorization_v1_api.create_namespaced_role_binding,
-            rb,
-            check_err=check_err,
-            **kwargs,
-        )
-
-    def role_binding_delete(
-        self, name: str, **kwargs
-    ) -> client.V1RoleBinding | None:
-        """
-        Delete RoleBinding by name.
-        """
-
-        return self._delete(
-            self.rbac_authorization_v1_api.delete_namespaced_role_binding,
-            name,
-            **kwargs,
-        )
-
-    def role_binding_get(
-        self, name: str, *, check_err: bool = True, **kwargs
-    ) -> client.V1RoleBinding | None:
+    def pod_get_many(
+        self, names: list[str], *, check_err: bool = True, **kwargs
+    ) -> list[client.V1Pod | None]:
         """
-        Get RoleBinding.
+        Get Pods by names in current namespace concurrently.
         """
 
-        return self._get(
-            self.rbac_authorization_v1_api.read_namespaced_role_binding,
-            name,
-            check_err,
-            **kwargs,
-        )
-
-    def role_binding_list(self, **kwargs) -> client.V1RoleBindingList:
-        """
-        List all RoleBindings.
-        """
-
-        return self._list(
-            self.rbac_authorization_v1_api.list_namespaced_role_binding,
-            **kwargs,
+        return self._get_many(
+            self.core_v1.read_namespaced_pod, names, check_err, **kwargs
         )
 
     def secret_get(
@@ -1191,175 +1312,27 @@ class KubeApi:
         Get Secret by name in current namespace.
         """
 
-        return self._get(
-            self.core_v1.read_namespaced_secret, name, check_err, **kwargs
+        sec = self._from_cache(
+            self.core_v1.list_namespaced_secret, name, kwargs
         )
-
-    def secret_create(
-        self, sec: client.V1Secret, *, check_err: bool = True, **kwargs
-    ) -> client.V1Secret:
-        """
-        Create Secret in current namespace.
-        """
-
-        return self._create(
-            self.core_v1.create_namespaced_secret,
-            sec,
-            check_err=check_err,
-            **kwargs,
-        )
-
-    def secret_delete(self, name: str, **kwargs) -> client.V1Secret | None:
-        """
-        Delete Secret by name in current namespace.
-        """
-
-        return self._delete(
-            self.core_v1.delete_namespaced_secret, name, **kwargs
-        )
-
-    def secret_list(self, **kwargs) -> client.V1SecretList:
-        """
-        List all Secrets in current namespace.
-        """
-
-        return self._list(self.core_v1.list_namespaced_secret, **kwargs)
-
-    def service_get(
-        self, name: str, *, check_err: bool = True, **kwargs
-    ) -> client.V1Secret | None:
-        """
-        Get Service by name in current namespace.
-        """
+        if sec is not None:
+            return sec
 
         return self._get(
-            self.core_v1.read_namespaced_service, name, check_err, **kwargs
-        )
-
-    def service_create(
-        self, svc: client.V1Service, *, check_err: bool = True, **kwargs
-    ) -> client.V1Service:
-        """
-        Create Service in current namespace.
-        """
-
-        return self._create(
-            self.core_v1.create_namespaced_service,
-            svc,
-            check_err=check_err,
-            **kwargs,
-        )
-
-    def service_delete(self, name: str, **kwargs) -> client.V1Service | None:
-        """
-        Delete Service by name in current namespace.
-        """
-
-        return self._delete(
-            self.core_v1.delete_namespaced_service, name, **kwargs
-        )
-
-    def service_list(self, **kwargs) -> client.V1ServiceList:
-        """
-        List all Service in current namespace.
-        """
-
-        return self._list(self.core_v1.list_namespaced_service, **kwargs)
-
-    def service_account_get(
-        self, name: str, *, check_err: bool = True, **kwargs
-    ) -> client.V1ServiceAccount | None:
-        """
-        Get ServiceAccount by name in current namespace.
-        """
-
-        return self._get(
-            self.core_v1.read_namespaced_service_account,
-            name,
-            check_err,
-            **kwargs,
-        )
-
-    def service_account_create(
-        self, sa: client.V1ServiceAccount, *, check_err: bool = True, **kwargs
-    ) -> client.V1ServiceAccount:
-        """
-        Create ServiceAccount in current namespace.
-        """
-
-        return self._create(
-            self.core_v1.create_namespaced_service_account,
-            sa,
-            check_err=check_err,
-            **kwargs,
-        )
-
-    def service_account_delete(
-        self, name: str, **kwargs
-    ) -> client.V1ServiceAccount | None:
-        """
-        Delete ServiceAccount by name in current namespace.
-        """
-
-        return self._delete(
-            self.core_v1.delete_namespaced_service_account, name, **kwargs
-        )
-
-    def service_account_list(self, **kwargs) -> client.V1ServiceAccountList:
-        """
-        List all ServiceAccount in current namespace.
-        """
-
-        return self._list(
-            self.core_v1.list_namespaced_service_account, **kwargs
-        )
-
-    def stateful_set_create(
-        self, sts: client.V1StatefulSet, *, check_err: bool = True, **kwargs
-    ) -> client.V1StatefulSet | None:
-        """
-        Create StatefulSet in current namespace.
-        """
-
-        return self._create(
-            self.apps_v1.create_namespaced_stateful_set,
-            sts,
-            check_err=check_err,
-            **kwargs,
-        )
-
-    def stateful_set_delete(
-        self, name: str, **kwargs
-    ) -> client.V1StatefulSet | None:
-        """
-        Delete StatefulSet by name in current namespace.
-        """
-
-        return self._delete(
-            self.apps_v1.delete_namespaced_stateful_set, name, **kwargs
+            self.core_v1.read_namespaced_secret, name, check_err, **kwargs
         )
 
-    def stateful_set_get(
-        self, name: str, *, check_err: bool = True, **kwargs
-    ) -> client.V1StatefulSet | None:
+    def secret_get_many(
+        self, names: list[str], *, check_err: bool = True, **kwargs
+    ) -> list[client.V1Secret | None]:
         """
-        Get StatefulSet by name in current namespace.
+        Get Secrets by names in current namespace concurrently.
         """
 
-        return self._get(
-            self.apps_v1.read_namespaced_stateful_set,
-            name,
-            check_err,
-            **kwargs,
+        return self._get_many(
+            self.core_v1.read_namespaced_secret, names, check_err, **kwargs
         )
 
-    def stateful_set_list(self, **kwargs) -> client.V1StatefulSetList:
-        """
-        List all StatefulSets in current namespace.
-        """
-
-        return self._list(self.apps_v1.list_namespaced_stateful_set, **kwargs)
-
     def scale_deployment(
         self, name: str, replicas: int, wait: bool = False, **kwargs
     ) -> client.V1Deployment:
@@ -1372,7 +1345,8 @@ class KubeApi:
         :param kwargs: See all parameters in apps_v1.patch_namespaced_deployment
         """
         return self._scale(
-            self.apps_v1.patch_namespaced_deployment,
+            self._apply_apps_v1.patch_namespaced_deployment,
+            "Deployment",
             name,
             replicas,
             wait,
@@ -1392,31 +1366,53 @@ class KubeApi:
         """
 
         return self._scale(
-            self.apps_v1.patch_namespaced_stateful_set,
+            self._apply_apps_v1.patch_namespaced_stateful_set,
+            "StatefulSet",
             name,
             replicas,
             wait,
             **kwargs,
         )
 
-    def scale_down_all(self):
-        """
-        Set replicas to 0 for all Deployments and StatefulSets
-        """
-
-        deployments = self.deployment_list()
-        for item in deployments.items:
-            if item.spec.replicas:
-                self.scale_deployment(item.metadata.name, 0)
-
-        stateful_sets = self.stateful_set_list()
-        for item in stateful_sets.items:
-            if item.spec.replicas:
-                self.scale_stateful_set(item.metadata.name, 0)
+    def scale_down_all(self, consistent: bool = False):
+        """
+        Set replicas to 0 for all Deployments and StatefulSets.
+        The lists and the scale requests are sent concurrently.
+
+        :param consistent: Kept for compatibility: the lists are paged,
+                           and paged lists are always read from etcd.
+        """
+
+        def scale_all(list_func, scale) -> list[concurrent.futures.Future]:
+            # the names are yielded page by page, the patches of a page are
+            # sent while the next one is fetched
+            return [
+                pool.submit(scale, name, 0)
+                for name in self._replicated(list_func)
+            ]
+
+        with concurrent.futures.ThreadPoolExecutor(SCALE_WORKERS) as pool:
+            # both lists are fetched concurrently
+            listings = [
+                pool.submit(
+                    scale_all,
+                    self.apps_v1.list_namespaced_deployment,
+                    self.scale_deployment,
+                ),
+                pool.submit(
+                    scale_all,
+                    self.apps_v1.list_namespaced_stateful_set,
+                    self.scale_stateful_set,
+                ),
+            ]
+            futures = [f for lf in listings for f in lf.result()]
+
+            for f in concurrent.futures.as_completed(futures):
+                f.result()
 
     def wait_pods(
         self,
-        label_selector: str,
+        label_selector: str | dict[str, str],
         msg: str = "",
         delay: int = 3,
         timeout: int = 120,
@@ -1424,6 +1420,18 @@ class KubeApi:
     ):
         """
         Waiting for Kubernetes object scaling by labels.
+
+        The pods are listed once and then followed with a watch, so the
+        wait ends as soon as the last pod becomes ready or is gone.
+        The list is served from the API server watch cache: a stale list
+        only delays the result, the watch replays every later change.
+        Pods are filtered by the API server and decoded as plain JSON,
+        they are never deserialized into models.
+
+        :param label_selector: Selector string or a dict of labels
+                               to match exactly.
+        :param delay: Upper bound of the backoff (1s, 2s, 4s ...) before
+                      listing again when the server closes the watch early.
         """
 
         info_msg = f"wait {msg if msg else 'scaling'} ..."
@@ -1431,23 +1439,65 @@ class KubeApi:
 
         time.sleep(start_delay)
 
-        while 1:
-            obj = self.pod_list(
-                field_selector="status.phase!=Succeeded",
-                label_selector=label_selector,
+        if isinstance(label_selector, dict):
+            label_selector = ",".join(
+                f"{k}={v}" for k, v in label_selector.items()
             )
-            # down to 0
-            if not obj.items:
-                return
 
-            # replicas equal availableReplicas
-            if all(map(lambda pod: is_pod_ready(pod), obj.items)):
+        kwargs = {
+            "field_selector": "status.phase!=Succeeded",
+            "label_selector": label_selector,
+        }
+        deadline = time.monotonic() + timeout
+        backoff = 1.0
+
+        while 1:
+            resp = self._list(
+                self.core_v1.list_namespaced_pod,
+                _preload_content=False,
+                **kwargs,
+            )
+            pods = json.loads(resp.data)
+            ready = {
+                p["metadata"]["uid"]: _is_raw_pod_ready(p)
+                for p in pods["items"] or ()
+            }
+            # down to 0 or replicas equal availableReplicas
+            if all(ready.values()):
                 return
 
-            if timeout <= 0:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
                 raise TimeoutError("Wait for scaling: timeout reached!")
 
             logging.info(info_msg)
 
-            timeout -= delay
-            time.sleep(delay)
+            # "object" makes the watch yield the decoded JSON as is
+            w = watch.Watch(return_type="object")
+            try:
+                for ev in w.stream(
+                    self.core_v1.list_namespaced_pod,
+                    self._ns,
+                    resource_version=pods["metadata"]["resourceVersion"],
+                    timeout_seconds=max(1, int(remaining)),
+                    **kwargs,
+                ):
+                    pod = ev["object"]
+                    uid = pod["metadata"]["uid"]
+                    if ev["type"] == "DELETED":
+                        ready.pop(uid, None)
+                    else:
+                        ready[uid] = _is_raw_pod_ready(pod)
+
+                    if all(ready.values()):
+                        w.stop()
+                        return
+            except ApiException as e:
+                # 410 Gone: the resource version is too old, list again
+                if e.status != 410:
+                    raise
+                continue
+
+            # the watch was closed by the server before the deadline
+            time.sleep(min(backoff, max(0, deadline - time.monotonic())))
+            backoff = min(backoff * 2, delay)
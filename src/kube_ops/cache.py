@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import copy
+import logging
+import threading
+import typing
+
+from kubernetes import watch
+from kubernetes.client.rest import ApiException
+
+
+class WatchCache:
+    """
+    In-memory copy of a Kubernetes resource list kept up to date
+    by a background watch.
+
+    The list is fetched once, then ADDED/MODIFIED/DELETED events are applied
+    as they arrive. Every `resync` seconds the watch is closed and the list
+    is fetched again to reconcile any missed event.
+
+    Cached objects are shared between callers and must be treated as
+    read-only.
+
+    :example: c = WatchCache(core_v1.list_namespaced_config_map, "default")
+              cm = c.get("kube-root-ca.crt")
+    """
+
+    def __init__(self, list_func, *args, resync: int = 60, **kwargs):
+        self._list_func = list_func
+        self._args = args
+        self._kwargs = kwargs
+        self._resync = resync
+
+        self._items: dict[str, typing.Any] = {}
+        self._resp = None
+        self._rv: str | None = None
+        self._lock = threading.RLock()
+        self._synced = threading.Event()
+        # set once a list attempt has finished, whether it succeeded or not
+        self._listed = threading.Event()
+        self._stopped = threading.Event()
+        self._watch = None
+
+        self._thread = threading.Thread(
+            target=self._run, name=f"watch-{list_func.__name__}", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def synced(self) -> bool:
+        return self._synced.is_set()
+
+    def get(self, name: str):
+        """
+        Get object by name.
+
+        :return: Cached object or None if it is not cached
+                 (or the initial list has not completed yet).
+        """
+
+        with self._lock:
+            return self._items.get(name)
+
+    def snapshot(self, timeout: float = None):
+        """
+        Get the list response with the currently cached items.
+
+        :param timeout: Seconds to wait for the first list attempt.
+
+        :return: List object (e.g. V1PodList) or None if no list
+                 has succeeded yet.
+        """
+
+        self._listed.wait(timeout)
+        if not self._synced.is_set():
+            return
+
+        with self._lock:
+            resp = copy.copy(self._resp)
+            resp.metadata = copy.copy(resp.metadata)
+            resp.metadata.resource_version = self._rv
+            resp.items = list(self._items.values())
+
+        return resp
+
+    def stop(self):
+        self._stopped.set()
+        if self._watch:
+            self._watch.stop()
+
+    def _relist(self) -> str:
+        try:
+            resp = self._list_func(
+                *self._args, resource_version="0", **self._kwargs
+            )
+            with self._lock:
+                self._items = {o.metadata.name: o for o in resp.items}
+                self._resp = resp
+                self._rv = resp.metadata.resource_version
+            self._synced.set()
+        finally:
+            # a failed list must not keep `snapshot` callers waiting
+            # until the retry after `resync`
+            self._listed.set()
+
+        return self._rv
+
+    def _run(self):
+        while not self._stopped.is_set():
+            try:
+                rv = self._relist()
+
+                self._watch = watch.Watch()
+                for ev in self._watch.stream(
+                    self._list_func,
+                    *self._args,
+                    resource_version=rv,
+                    timeout_seconds=self._resync,
+                    **self._kwargs,
+                ):
+                    obj = ev["object"]
+                    with self._lock:
+                        if ev["type"] == "DELETED":
+                            self._items.pop(obj.metadata.name, None)
+                        else:
+                            self._items[obj.metadata.name] = obj
+                        self._rv = obj.metadata.resource_version
+            except ApiException as e:
+                # 410 Gone: the resource version is too old, list again
+                if e.status != 410:
+                    logging.error(e)
+                    self._stopped.wait(self._resync)
+            except Exception as e:
+                logging.error(e)
+                self._stopped.wait(self._resync)
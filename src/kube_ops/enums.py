@@ -1,7 +1,61 @@
+from __future__ import annotations
+
 import enum
+import sys
+
+
+class _CachedStrEnum(enum.StrEnum):
+    """
+    StrEnum base which interns member values and precomputes
+    the value/member tuples once at class creation.
+    """
+
+    # No `__slots__ = ()` here: Enum keeps `_value_`, `_name_` and
+    # `_sort_order_` in each member's `__dict__`, so slots would not
+    # drop the per-member dict.
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        for m in cls:
+            object.__setattr__(m, "_value_", sys.intern(str(m._value_)))
+
+        cls._value2member_map_ = {m._value_: m for m in cls}
+        cls._values_tuple = tuple(m._value_ for m in cls)
+        cls._members_tuple = tuple(cls)
+        cls._value_set = frozenset(cls._values_tuple)
+        cls.__kube_lookup__ = dict(cls._value2member_map_)
 
+    @classmethod
+    def values(cls) -> tuple[str, ...]:
+        return cls._values_tuple
 
-class SecretType(enum.StrEnum):
+    @classmethod
+    def choices(cls) -> tuple[_CachedStrEnum, ...]:
+        return cls._members_tuple
+
+    @classmethod
+    def from_value(cls, v: str) -> _CachedStrEnum:
+        """
+        Return the member for `v` with a single dict lookup, bypassing
+        the generic Enum call machinery.
+        """
+        m = cls.__kube_lookup__.get(v)
+        if m is None:
+            raise ValueError(f"{v!r} is not a valid {cls.__qualname__}")
+
+        return m
+
+    @classmethod
+    def plain(cls, v: str) -> str:
+        """
+        Return the bare interned `str` for a member or its raw value,
+        ready to be written into a manifest.
+        """
+        return cls.from_value(v)._value_
+
+
+class SecretType(_CachedStrEnum):
     BasicAuth = "kubernetes.io/basic-auth"
     BootstrapToken = "bootstrap.kubernetes.io/token"
     DockerConfigJSON = "kubernetes.io/dockerconfigjson"
@@ -13,53 +67,63 @@ class SecretType(enum.StrEnum):
     TLS = "kubernetes.io/tls"
 
 
-class ServiceType(enum.StrEnum):
+class ServiceType(_CachedStrEnum):
     ClusterIP = "ClusterIP"
     LoadBalancer = "LoadBalancer"
     NodePort = "NodePort"
     ExternalName = "ExternalName"
 
 
-class StatefulSetUpdateStrategy(enum.StrEnum):
+class StatefulSetUpdateStrategy(_CachedStrEnum):
     OnDelete = "OnDelete"
     RollingUpdate = "RollingUpdate"
 
 
-class PVCAccessMode(enum.StrEnum):
+class PVCAccessMode(_CachedStrEnum):
     ReadWriteOnce = "ReadWriteOnce"
     ReadWriteMany = "ReadWriteMany"
     ReadOnlyMany = "ReadOnlyMany"
 
 
-class IngressRulePathType(enum.StrEnum):
+class IngressRulePathType(_CachedStrEnum):
     ImplementationSpecific = "ImplementationSpecific"
     Exact = "Exact"
     Prefix = "Prefix"
 
 
-class ImagePullPolicy(enum.StrEnum):
+class ImagePullPolicy(_CachedStrEnum):
     Always = "Always"
     IfNotPresent = "IfNotPresent"
     Never = "Never"
 
 
-class MatchExprOperator(enum.StrEnum):
+class MatchExprOperator(_CachedStrEnum):
     In = "In"
     NotIn = "NotIn"
     Exists = "Exists"
     DoesNotExist = "DoesNotExist"
 
 
-class VolumeModes(enum.StrEnum):
+class VolumeModes(_CachedStrEnum):
     Filesystem = "Filesystem"
     Block = "Block"
 
 
-class DeploymentUpdateStrategy(enum.StrEnum):
+class DeploymentUpdateStrategy(_CachedStrEnum):
     RollingUpdate = "RollingUpdate"
     Recreate = "Recreate"
 
 
-class PodManagementPolicy(enum.StrEnum):
+class PodManagementPolicy(_CachedStrEnum):
     OrderedReady = "OrderedReady"
     Parallel = "Parallel"
+
+
+def is_valid(cls: type[_CachedStrEnum], value: str) -> bool:
+    """
+    Check whether `value` is one of the values of the enum `cls`.
+    """
+    try:
+        return value in cls._value_set
+    except TypeError:
+        return False
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import base64
 import json
-from copy import deepcopy
 from typing import Optional
 
 from kubernetes import client
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .api import KubeApi, CustomObjectDef
 from .enums import (
     SecretType,
@@ -24,25 +29,52 @@ from .templates import (
     Container,
     V1Primitive,
     ObjectMetadata,
-    LabelSelector,
-    dict_str,
+    _LabelSelector,
+    dict_str_fast,
+    _clone,
+    _BUILDER_SLOTS,
+    _METADATA_SLOTS,
+    _POD_SPEC_SLOTS,
+    _PRIMITIVE_SLOTS,
+    _SELECTOR_SLOTS,
+    _TEMPLATE_SPEC_SLOTS,
+)
+
+
+def _json_bytes(o) -> bytes:
+    """
+    Compact JSON, the same bytes with and without orjson installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(o)
+
+    return json.dumps(o, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+_JOB_TEMPLATE = client.V1Job(
+    api_version="batch/v1",
+    kind="Job",
+    spec=client.V1JobSpec(template=client.V1PodTemplateSpec()),
 )
 
 
 class Job(PodTemplateSpec, ObjectMetadata):
+    __slots__ = (
+        *_BUILDER_SLOTS,
+        *_METADATA_SLOTS,
+        *_TEMPLATE_SPEC_SLOTS,
+        "_job",
+    )
+
     def __init__(self, name: str, c: Container):
         super().__init__(c)
         ObjectMetadata.__init__(self, name)
 
-        self._job = client.V1Job(
-            api_version="batch/v1",
-            kind="Job",
-            spec=client.V1JobSpec(template=client.V1PodTemplateSpec()),
-        )
+        self._job = _clone(_JOB_TEMPLATE)
 
     @property
     def manifest(self) -> client.V1Job:
-        o = deepcopy(self._job)
+        o = _clone(self._job)
         o.metadata = self._metadata
         o.spec.template = super().manifest
         return o
@@ -62,37 +94,48 @@ class Job(PodTemplateSpec, ObjectMetadata):
         return kube_api.job_create(self.manifest)
 
 
+_CRON_JOB_TEMPLATE = client.V1CronJob(
+    api_version="batch/v1",
+    kind="CronJob",
+    metadata=client.V1ObjectMeta(),
+    spec=client.V1CronJobSpec(
+        job_template=client.V1JobTemplateSpec(), schedule="0 0 * * *"
+    ),
+)
+
+
 class CronJob(JobTemplateSpec, ObjectMetadata):
+    __slots__ = (
+        *_BUILDER_SLOTS,
+        *_METADATA_SLOTS,
+        *_TEMPLATE_SPEC_SLOTS,
+        "_cj",
+    )
+
     def __init__(self, name: str, c: Container):
         super().__init__(c)
         ObjectMetadata.__init__(self, name)
 
-        self._cj = client.V1CronJob(
-            api_version="batch/v1",
-            kind="CronJob",
-            metadata=client.V1ObjectMeta(name=name),
-            spec=client.V1CronJobSpec(
-                job_template=client.V1JobTemplateSpec(), schedule="0 0 * * *"
-            ),
-        )
+        self._cj = _clone(_CRON_JOB_TEMPLATE)
+        self._cj.metadata.name = name
 
     @property
     def manifest(self) -> client.V1CronJob:
-        o = deepcopy(self._cj)
+        o = _clone(self._cj)
         o.spec.job_template = super().manifest
         return o
 
-    def set_annotations(self, **kwargs):
-        self._cj.metadata.annotations = dict_str(**kwargs)
+    def set_annotations(self, data: dict[str, str] = None, /, **kwargs):
+        self._cj.metadata.annotations = dict_str_fast(data, kwargs)
 
-    def set_labels(self, **kwargs):
-        self._cj.metadata.labels = dict_str(**kwargs)
+    def set_labels(self, data: dict[str, str] = None, /, **kwargs):
+        self._cj.metadata.labels = dict_str_fast(data, kwargs)
 
-    def set_pod_annotations(self, **kwargs):
-        super().set_annotations(**kwargs)
+    def set_pod_annotations(self, data: dict[str, str] = None, /, **kwargs):
+        super().set_annotations(data, **kwargs)
 
-    def set_pod_labels(self, **kwargs):
-        super().set_labels(**kwargs)
+    def set_pod_labels(self, data: dict[str, str] = None, /, **kwargs):
+        super().set_labels(data, **kwargs)
 
     def set_schedule(self, cron: str):
         self._cj.spec.schedule = cron
@@ -121,19 +164,33 @@ class CronJob(JobTemplateSpec, ObjectMetadata):
         return kube_api.cron_job_create(self.manifest)
 
 
+_INGRESS_TEMPLATE = client.V1Ingress(
+    api_version="networking.k8s.io/v1",
+    kind="Ingress",
+    spec=client.V1IngressSpec(),
+)
+
+
 class Ingress(ObjectMetadata):
+    __slots__ = (
+        *_BUILDER_SLOTS,
+        *_METADATA_SLOTS,
+        "_obj",
+        "_rules_by_host",
+        "_paths_by_host",
+    )
+
     def __init__(self, name: str):
         super().__init__(name)
 
-        self._obj = client.V1Ingress(
-            api_version="networking.k8s.io/v1",
-            kind="Ingress",
-            spec=client.V1IngressSpec(),
-        )
+        self._obj = _clone(_INGRESS_TEMPLATE)
+
+        self._rules_by_host: dict[str, client.V1IngressRule] = {}
+        self._paths_by_host: dict[str, set[str]] = {}
 
     @property
     def manifest(self) -> client.V1Ingress:
-        o = deepcopy(self._obj)
+        o = _clone(self._obj)
         o.metadata = self._metadata
 
         return o
@@ -157,38 +214,36 @@ class Ingress(ObjectMetadata):
         service_name: str,
         path: str = None,
         service_port: Optional[str, int] = "http",
-        path_type: IngressRulePathType = IngressRulePathType.Prefix,
+        path_type: IngressRulePathType | str = IngressRulePathType.Prefix,
         ref: client.V1TypedLocalObjectReference = None,
     ):
         if not path:
             path = "/"
 
+        paths = self._paths_by_host.get(host)
+        if paths is not None and path in paths:
+            return
+
         backend_path = client.V1HTTPIngressPath(
             backend=self._ingress_backend(service_name, service_port, ref),
             path=path,
-            path_type=path_type.value,
+            path_type=IngressRulePathType.plain(path_type),
         )
 
-        if self._obj.spec.rules is None:
-            self._obj.spec.rules = []
+        rule = self._rules_by_host.get(host)
+        if rule is None:
+            if self._obj.spec.rules is None:
+                self._obj.spec.rules = []
 
-        for i, rule in enumerate(self._obj.spec.rules):
-            if rule.host == host:
-                for p in rule.http.paths:
-                    if p.path == path:
-                        return
-
-                rule.http.paths.append(backend_path)
-
-                self._obj.spec.rules[i] = rule
-                return
-
-        self._obj.spec.rules.append(
-            client.V1IngressRule(
-                host=host,
-                http=client.V1HTTPIngressRuleValue(paths=[backend_path]),
+            rule = client.V1IngressRule(
+                host=host, http=client.V1HTTPIngressRuleValue(paths=[])
             )
-        )
+            self._obj.spec.rules.append(rule)
+            self._rules_by_host[host] = rule
+            paths = self._paths_by_host[host] = set()
+
+        rule.http.paths.append(backend_path)
+        paths.add(path)
 
     def add_tls(self, *hosts: str, secret_name: str = None):
         if self._obj.spec.tls:
@@ -231,6 +286,8 @@ class Ingress(ObjectMetadata):
 
 
 class Route(ObjectMetadata):
+    __slots__ = (*_BUILDER_SLOTS, *_METADATA_SLOTS, "_route")
+
     def __init__(self, name: str):
         super().__init__(name)
         self._route = {
@@ -340,25 +397,30 @@ class Route(ObjectMetadata):
         )
 
 
+_SERVICE_TEMPLATE = client.V1Service(
+    api_version="v1", kind="Service", spec=client.V1ServiceSpec()
+)
+
+
 class Service(ObjectMetadata):
+    __slots__ = (*_BUILDER_SLOTS, *_METADATA_SLOTS, "_svc")
+
     def __init__(self, name: str):
         super().__init__(name)
 
-        self._svc = client.V1Service(
-            api_version="v1", kind="Service", spec=client.V1ServiceSpec()
-        )
+        self._svc = _clone(_SERVICE_TEMPLATE)
 
     @property
     def manifest(self) -> client.V1Service:
-        svc = deepcopy(self._svc)
+        svc = _clone(self._svc)
         svc.metadata = self._metadata
         return svc
 
-    def set_selector(self, **kwargs):
-        self._svc.spec.selector = dict_str(**kwargs)
+    def set_selector(self, data: dict[str, str] = None, /, **kwargs):
+        self._svc.spec.selector = dict_str_fast(data, kwargs)
 
-    def set_type(self, t: ServiceType):
-        self._svc.spec.type = t.value
+    def set_type(self, t: ServiceType | str):
+        self._svc.spec.type = ServiceType.plain(t)
 
     def add_port(
         self,
@@ -395,28 +457,30 @@ class Service(ObjectMetadata):
         return kube_api.service_create(self.manifest)
 
 
+_POD_TEMPLATE = client.V1Pod(api_version="v1", kind="Pod")
+
+
 class Pod(PodSpec, ObjectMetadata):
+    __slots__ = (*_BUILDER_SLOTS, *_METADATA_SLOTS, *_POD_SPEC_SLOTS, "_pod")
+
     def __init__(self, name: str, c: Container):
         super().__init__(c)
         ObjectMetadata.__init__(self, name)
 
-        self._pod = client.V1Pod(
-            api_version="v1",
-            kind="Pod",
-        )
+        self._pod = _clone(_POD_TEMPLATE)
 
     @property
     def manifest(self) -> client.V1Pod:
-        o = deepcopy(self._pod)
+        o = _clone(self._pod)
         o.metadata = self._metadata
         o.spec = super().manifest
         return o
 
-    def set_annotations(self, **kwargs):
-        self._pod.metadata.annotations = dict_str(**kwargs)
+    def set_annotations(self, data: dict[str, str] = None, /, **kwargs):
+        self._pod.metadata.annotations = dict_str_fast(data, kwargs)
 
-    def set_labels(self, **kwargs):
-        self._pod.metadata.labels = dict_str(**kwargs)
+    def set_labels(self, data: dict[str, str] = None, /, **kwargs):
+        self._pod.metadata.labels = dict_str_fast(data, kwargs)
 
     def create(self, kube_api: KubeApi = None) -> client.V1Pod:
         if kube_api is None:
@@ -424,17 +488,19 @@ class Pod(PodSpec, ObjectMetadata):
         return kube_api.pod_create(self.manifest)
 
 
-class _KubeObjectWrapper(PodTemplateSpec, ObjectMetadata, LabelSelector):
+class _KubeObjectWrapper(PodTemplateSpec, ObjectMetadata, _LabelSelector):
+    __slots__ = ()
+
     def __init__(self, name: str, c: Container):
         super().__init__(c)
         ObjectMetadata.__init__(self, name)
-        LabelSelector.__init__(self)
+        _LabelSelector.__init__(self)
 
         self._obj = None
 
     @property
     def manifest(self):
-        o = deepcopy(self._obj)
+        o = _clone(self._obj)
         o.metadata = self._metadata
         o.spec.selector = self._selector
         o.spec.template = super().manifest
@@ -451,7 +517,7 @@ class _KubeObjectWrapper(PodTemplateSpec, ObjectMetadata, LabelSelector):
                 name = self.name
 
         svc = Service(name)
-        svc.set_selector(**self._selector.match_labels)
+        svc.set_selector(self._selector.match_labels)
 
         for c in self._containers:
             m = c.manifest
@@ -469,20 +535,31 @@ class _KubeObjectWrapper(PodTemplateSpec, ObjectMetadata, LabelSelector):
         return svc
 
 
+_DEPLOYMENT_TEMPLATE = client.V1Deployment(
+    api_version="apps/v1",
+    kind="Deployment",
+    spec=client.V1DeploymentSpec(
+        selector=client.V1LabelSelector(),
+        template=client.V1PodTemplateSpec(
+            spec=client.V1PodSpec(containers=[]),
+        ),
+    ),
+)
+
+
 class Deployment(_KubeObjectWrapper):
+    __slots__ = (
+        *_BUILDER_SLOTS,
+        *_METADATA_SLOTS,
+        *_TEMPLATE_SPEC_SLOTS,
+        *_SELECTOR_SLOTS,
+        "_obj",
+    )
+
     def __init__(self, name: str, c: Container):
         super().__init__(name, c)
 
-        self._obj = client.V1Deployment(
-            api_version="apps/v1",
-            kind="Deployment",
-            spec=client.V1DeploymentSpec(
-                selector=client.V1LabelSelector(),
-                template=client.V1PodTemplateSpec(
-                    spec=client.V1PodSpec(containers=[]),
-                ),
-            ),
-        )
+        self._obj = _clone(_DEPLOYMENT_TEMPLATE)
 
     @property
     def manifest(self) -> client.V1Deployment:
@@ -497,12 +574,14 @@ class Deployment(_KubeObjectWrapper):
 
     def set_strategy(
         self,
-        typ: DeploymentUpdateStrategy = DeploymentUpdateStrategy.RollingUpdate,
+        typ: (
+            DeploymentUpdateStrategy | str
+        ) = DeploymentUpdateStrategy.RollingUpdate,
         max_surge: Optional[str, int] = None,
         max_unavailable: Optional[str, int] = None,
     ):
         self._obj.spec.strategy = client.V1DeploymentStrategy(
-            type=typ.value,
+            type=DeploymentUpdateStrategy.plain(typ),
             rolling_update=client.V1RollingUpdateDeployment(
                 max_surge=max_surge, max_unavailable=max_unavailable
             ),
@@ -514,19 +593,30 @@ class Deployment(_KubeObjectWrapper):
         return kube_api.deployment_create(self.manifest)
 
 
+_STATEFUL_SET_TEMPLATE = client.V1StatefulSet(
+    api_version="`apps/v1",
+    kind="StatefulSet",
+    spec=client.V1StatefulSetSpec(
+        service_name="",
+        selector=client.V1LabelSelector(),
+        template=client.V1PodTemplateSpec(),
+    ),
+)
+
+
 class StatefulSet(_KubeObjectWrapper):
+    __slots__ = (
+        *_BUILDER_SLOTS,
+        *_METADATA_SLOTS,
+        *_TEMPLATE_SPEC_SLOTS,
+        *_SELECTOR_SLOTS,
+        "_obj",
+    )
+
     def __init__(self, name: str, c: Container):
         super().__init__(name, c)
 
-        self._obj = client.V1StatefulSet(
-            api_version="`apps/v1",
-            kind="StatefulSet",
-            spec=client.V1StatefulSetSpec(
-                service_name="",
-                selector=client.V1LabelSelector(),
-                template=client.V1PodTemplateSpec(),
-            ),
-        )
+        self._obj = _clone(_STATEFUL_SET_TEMPLATE)
 
     @property
     def manifest(self) -> client.V1StatefulSet:
@@ -537,13 +627,15 @@ class StatefulSet(_KubeObjectWrapper):
 
     def set_strategy(
         self,
-        typ: StatefulSetUpdateStrategy = StatefulSetUpdateStrategy.RollingUpdate,
+        typ: (
+            StatefulSetUpdateStrategy | str
+        ) = StatefulSetUpdateStrategy.RollingUpdate,
         max_unavailable: Optional[str, int] = None,
         partition: Optional[int] = None,
     ):
 
         self._obj.spec.update_strategy = client.V1StatefulSetUpdateStrategy(
-            type=typ.value,
+            type=StatefulSetUpdateStrategy.plain(typ),
             rolling_update=client.V1RollingUpdateStatefulSetStrategy(
                 max_unavailable=max_unavailable, partition=partition
             ),
@@ -560,8 +652,10 @@ class StatefulSet(_KubeObjectWrapper):
         )
         self._obj.spec.persistent_volume_claim_retention_policy = o
 
-    def set_pod_management_policy(self, policy: PodManagementPolicy):
-        self._obj.spec.pod_management_policy = policy.value
+    def set_pod_management_policy(self, policy: PodManagementPolicy | str):
+        self._obj.spec.pod_management_policy = PodManagementPolicy.plain(
+            policy
+        )
 
     def add_volume_claim_templates(self, pvc: client.V1PersistentVolumeClaim):
         if self._obj.spec.volume_claim_templates:
@@ -579,21 +673,30 @@ class StatefulSet(_KubeObjectWrapper):
         return kube_api.stateful_set_create(self.manifest)
 
 
+_SECRET_TEMPLATE = client.V1Secret(api_version="v1", kind="Secret")
+
+
 class Secret(ObjectMetadata, V1Primitive):
-    def __init__(self, name: str, typ: SecretType = SecretType.Opaque):
+    __slots__ = (
+        *_BUILDER_SLOTS,
+        *_METADATA_SLOTS,
+        *_PRIMITIVE_SLOTS,
+        "_secret",
+    )
+
+    def __init__(self, name: str, typ: SecretType | str = SecretType.Opaque):
         super().__init__(name)
         V1Primitive.__init__(self)
 
-        self._secret = client.V1Secret(
-            api_version="v1", kind="Secret", type=typ.value
-        )
+        self._secret = _clone(_SECRET_TEMPLATE)
+        self._secret.type = SecretType.plain(typ)
 
     @property
     def manifest(self):
-        sec = deepcopy(self._secret)
+        sec = _clone(self._secret)
         sec.metadata = self._metadata
         sec.immutable = self._immutable
-        if self._binary_data:
+        if self._binary_data is not None:
             sec.data = self._binary_data
 
         return sec
@@ -609,10 +712,13 @@ class Secret(ObjectMetadata, V1Primitive):
 
 
 class SecretImagePull(Secret):
+    __slots__ = ("_registries", "_auths_dirty")
+
     def __init__(self, name: str):
         super().__init__(name, SecretType.DockerConfigJSON)
 
         self._registries = {}
+        self._auths_dirty = True
 
     def add_registry(
         self, registry: str, username: str, password: str, email: str
@@ -626,16 +732,25 @@ class SecretImagePull(Secret):
             "email": email,
             "auth": self.to_base64(f"{username}:{password}"),
         }
+        self._auths_dirty = True
 
     @property
     def manifest(self):
-        auth = json.dumps({"auths": self._registries})
-        self.set(**{".dockerconfigjson": auth})
+        if self._auths_dirty:
+            auth = _json_bytes({"auths": self._registries})
+            if self._binary_data is None:
+                self._binary_data = {}
+            self._binary_data[".dockerconfigjson"] = base64.b64encode(
+                auth
+            ).decode()
+            self._auths_dirty = False
 
         return super().manifest
 
 
 class SecretTLS(Secret):
+    __slots__ = ()
+
     def __init__(self, name: str):
         super().__init__(name, SecretType.TLS)
 
@@ -648,6 +763,8 @@ class SecretTLS(Secret):
 
 
 class SecretServiceAccountToken(Secret):
+    __slots__ = ()
+
     def __init__(self, name: str):
         super().__init__(name, SecretType.ServiceAccountToken)
 
@@ -659,24 +776,26 @@ class SecretServiceAccountToken(Secret):
         super().set(**data)
 
 
+_CONFIG_MAP_TEMPLATE = client.V1ConfigMap(api_version="v1", kind="ConfigMap")
+
+
 class ConfigMap(ObjectMetadata, V1Primitive):
+    __slots__ = (*_BUILDER_SLOTS, *_METADATA_SLOTS, *_PRIMITIVE_SLOTS, "_cm")
+
     def __init__(self, name: str):
         super().__init__(name)
         V1Primitive.__init__(self)
 
-        self._cm = client.V1ConfigMap(
-            api_version="v1",
-            kind="ConfigMap",
-        )
+        self._cm = _clone(_CONFIG_MAP_TEMPLATE)
 
     @property
     def manifest(self):
-        cm = deepcopy(self._cm)
+        cm = _clone(self._cm)
         cm.metadata = self._metadata
         cm.immutable = self._immutable
-        if self._string_data:
+        if self._string_data is not None:
             cm.data = self._string_data
-        if self._binary_data:
+        if self._binary_data is not None:
             cm.binary_data = self._binary_data
 
         return cm
@@ -691,15 +810,20 @@ class ConfigMap(ObjectMetadata, V1Primitive):
         return kube_api.configmap_create(self.manifest)
 
 
+_NAMESPACE_TEMPLATE = client.V1Namespace(api_version="v1", kind="Namespace")
+
+
 class Namespace(ObjectMetadata):
+    __slots__ = (*_BUILDER_SLOTS, *_METADATA_SLOTS, "_ns")
+
     def __init__(self, name: str):
         super().__init__(name)
 
-        self._ns = client.V1Namespace(api_version="v1", kind="Namespace")
+        self._ns = _clone(_NAMESPACE_TEMPLATE)
 
     @property
     def manifest(self) -> client.V1Namespace:
-        ns = deepcopy(self._ns)
+        ns = _clone(self._ns)
         ns.metadata = self._metadata
         return ns
 
@@ -709,28 +833,33 @@ class Namespace(ObjectMetadata):
         return kube_api.namespace_create(self.manifest)
 
 
-class PersistentVolumeClaim(ObjectMetadata, LabelSelector):
+_PVC_TEMPLATE = client.V1PersistentVolumeClaim(
+    api_version="v1",
+    kind="PersistentVolumeClaim",
+    spec=client.V1PersistentVolumeClaimSpec(
+        access_modes=[],
+        resources=client.V1ResourceRequirements(),
+    ),
+)
+
+
+class PersistentVolumeClaim(ObjectMetadata, _LabelSelector):
+    __slots__ = (*_BUILDER_SLOTS, *_METADATA_SLOTS, *_SELECTOR_SLOTS, "_pvc")
+
     def __init__(self, name: str):
         super().__init__(name)
 
-        self._pvc = client.V1PersistentVolumeClaim(
-            api_version="v1",
-            kind="PersistentVolumeClaim",
-            spec=client.V1PersistentVolumeClaimSpec(
-                access_modes=[],
-                resources=client.V1ResourceRequirements(),
-            ),
-        )
+        self._pvc = _clone(_PVC_TEMPLATE)
 
     @property
     def manifest(self) -> client.V1PersistentVolumeClaim:
-        pvc = deepcopy(self._pvc)
+        pvc = _clone(self._pvc)
         pvc.metadata = self._metadata
         pvc.spec.selector = self._selector
         return pvc
 
-    def set_access_modes(self, *args: PVCAccessMode):
-        self._pvc.spec.access_modes = [a.value for a in args]
+    def set_access_modes(self, *args: PVCAccessMode | str):
+        self._pvc.spec.access_modes = [PVCAccessMode.plain(a) for a in args]
 
     def set_data_source(self, name: str, api_group: str, kind: str):
         self._pvc.spec.data_source = client.V1TypedLocalObjectReference(
@@ -747,8 +876,8 @@ class PersistentVolumeClaim(ObjectMetadata, LabelSelector):
     def set_storage_class_name(self, name: str):
         self._pvc.spec.storage_class_name = name
 
-    def set_volume_mode(self, mode: VolumeModes):
-        self._pvc.spec.volume_mode = mode.value
+    def set_volume_mode(self, mode: VolumeModes | str):
+        self._pvc.spec.volume_mode = VolumeModes.plain(mode)
 
     def set_volume_name(self, name: str):
         self._pvc.spec.volume_name = name
@@ -767,17 +896,22 @@ class PersistentVolumeClaim(ObjectMetadata, LabelSelector):
         return kube_api.pvc_create(self.manifest)
 
 
+_SERVICE_ACCOUNT_TEMPLATE = client.V1ServiceAccount(
+    api_version="v1", kind="ServiceAccount"
+)
+
+
 class ServiceAccount(ObjectMetadata):
+    __slots__ = (*_BUILDER_SLOTS, *_METADATA_SLOTS, "_sa")
+
     def __init__(self, name):
         super().__init__(name)
 
-        self._sa = client.V1ServiceAccount(
-            api_version="v1", kind="ServiceAccount"
-        )
+        self._sa = _clone(_SERVICE_ACCOUNT_TEMPLATE)
 
     @property
     def manifest(self) -> client.V1ServiceAccount:
-        sa = deepcopy(self._sa)
+        sa = _clone(self._sa)
         sa.metadata = self._metadata
         return sa
 
@@ -801,21 +935,29 @@ class ServiceAccount(ObjectMetadata):
         return kube_api.service_account_create(self.manifest)
 
 
+_ROLE_TEMPLATES = {
+    False: client.V1Role(
+        api_version="rbac.authorization.k8s.io/v1", kind="Role", rules=[]
+    ),
+    True: client.V1ClusterRole(
+        api_version="rbac.authorization.k8s.io/v1",
+        kind="ClusterRole",
+        rules=[],
+    ),
+}
+
+
 class _RoleWrapper(ObjectMetadata):
+    __slots__ = (*_BUILDER_SLOTS, *_METADATA_SLOTS, "_role")
+
     def __init__(self, name: str, cluster_scope: bool = False):
         super().__init__(name)
 
-        kind, obj = "Role", client.V1Role
-        if cluster_scope:
-            kind, obj = "ClusterRole", client.V1ClusterRole
-
-        self._role = obj(
-            api_version="rbac.authorization.k8s.io/v1", kind=kind, rules=[]
-        )
+        self._role = _clone(_ROLE_TEMPLATES[bool(cluster_scope)])
 
     @property
     def manifest(self) -> client.V1Role | client.V1ClusterRole:
-        role = deepcopy(self._role)
+        role = _clone(self._role)
         role.metadata = self._metadata
         return role
 
@@ -823,26 +965,37 @@ class _RoleWrapper(ObjectMetadata):
         self._role.rules.append(rule)
 
 
+_ROLE_BINDING_TEMPLATES = {
+    False: client.V1RoleBinding(
+        api_version="rbac.authorization.k8s.io/v1",
+        kind="Role",
+        role_ref=client.V1RoleRef("rbac.authorization.k8s.io", "Role", ""),
+        subjects=[],
+    ),
+    True: client.V1ClusterRoleBinding(
+        api_version="rbac.authorization.k8s.io/v1",
+        kind="ClusterRole",
+        role_ref=client.V1RoleRef(
+            "rbac.authorization.k8s.io", "ClusterRole", ""
+        ),
+        subjects=[],
+    ),
+}
+
+
 class _RoleBindingWrapper(ObjectMetadata):
+    __slots__ = (*_BUILDER_SLOTS, *_METADATA_SLOTS, "_role_binding")
+
     def __init__(self, name: str, cluster_scope: bool = False):
         super().__init__(name)
 
-        kind, obj = "Role", client.V1RoleBinding
-        if cluster_scope:
-            kind, obj = "ClusterRole", client.V1ClusterRoleBinding
-
-        self._role_binding = obj(
-            api_version="rbac.authorization.k8s.io/v1",
-            kind=kind,
-            role_ref=client.V1RoleRef(
-                "rbac.authorization.k8s.io", kind, ""
-            ),
-            subjects=[],
+        self._role_binding = _clone(
+            _ROLE_BINDING_TEMPLATES[bool(cluster_scope)]
         )
 
     @property
     def manifest(self) -> client.V1RoleBinding | client.V1ClusterRoleBinding:
-        rb = deepcopy(self._role_binding)
+        rb = _clone(self._role_binding)
         rb.metadata = self._metadata
         return rb
 
@@ -866,6 +1019,8 @@ class _RoleBindingWrapper(ObjectMetadata):
 
 
 class Role(_RoleWrapper):
+    __slots__ = ()
+
     def __init__(self, name: str):
         super().__init__(name)
 
@@ -880,6 +1035,8 @@ class Role(_RoleWrapper):
 
 
 class RoleBinding(_RoleBindingWrapper):
+    __slots__ = ()
+
     def __init__(self, name: str):
         super().__init__(name)
 
@@ -894,6 +1051,8 @@ class RoleBinding(_RoleBindingWrapper):
 
 
 class ClusterRole(_RoleWrapper):
+    __slots__ = ()
+
     def __init__(self, name: str):
         super().__init__(name, True)
 
@@ -916,6 +1075,8 @@ class ClusterRole(_RoleWrapper):
 
 
 class ClusterRoleBinding(_RoleBindingWrapper):
+    __slots__ = ()
+
     def __init__(self, name: str):
         super().__init__(name, True)
 
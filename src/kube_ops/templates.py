@@ -1,7 +1,7 @@
 import base64
+import functools
 import json
 import typing
-from copy import deepcopy
 
 from kubernetes import client
 
@@ -9,24 +9,151 @@ from .enums import ImagePullPolicy, MatchExprOperator
 
 
 def dict_str(**kwargs):
-    if not kwargs:
+    return dict_str_fast(kwargs)
+
+
+def dict_str_fast(
+    d: dict | None, extra: dict | None = None
+) -> dict[str, str] | None:
+    """
+    `dict_str` for existing dicts, e.g. the `kwargs` of the caller, without
+    re-packing them. The items of `extra` take precedence over `d`.
+    """
+    if extra:
+        d = {**d, **extra} if d else extra
+
+    if not d:
         return
 
-    return dict(map(lambda kv: (kv[0], str(kv[1])), kwargs.items()))
+    return {k: v if v.__class__ is str else str(v) for k, v in d.items()}
+
+
+def _clone(o):
+    """
+    Copy a tree of Kubernetes models, lists and dicts.
+
+    Unlike `deepcopy`, scalars and the client `Configuration` referenced
+    by every model are shared instead of being copied.
+    """
+
+    if isinstance(o, list):
+        return [_clone(v) for v in o]
+
+    if isinstance(o, dict):
+        return {k: _clone(v) for k, v in o.items()}
+
+    if hasattr(o, "openapi_types"):
+        c = object.__new__(o.__class__)
+        c.__dict__.update((k, _clone(v)) for k, v in o.__dict__.items())
+        return c
+
+    return o
+
+
+_MUTATOR_PREFIXES = ("set_", "add_", "enable_")
+
+# Attributes of the builder mixins. A class can not have several bases with
+# non-empty `__slots__`, so the mixins declare none and the concrete classes
+# list the attributes of all their bases.
+_BUILDER_SLOTS = ("_rev", "_manifest_cache", "_manifest_building")
+_METADATA_SLOTS = ("_metadata",)
+_PRIMITIVE_SLOTS = ("_string_data", "_binary_data", "_immutable")
+_POD_SPEC_SLOTS = ("_containers", "_init_containers", "_pod_spec")
+_TEMPLATE_SPEC_SLOTS = (*_POD_SPEC_SLOTS, "_template_spec")
+_SELECTOR_SLOTS = ("_selector", "_match_expr_index")
+
+
+def _mutator(func):
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        self._rev = getattr(self, "_rev", 0) + 1
+        return func(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _cached_manifest(fget):
+    @functools.wraps(fget)
+    def manifest(self):
+        # the inner `super().manifest` calls of a build are not cached
+        if getattr(self, "_manifest_building", False):
+            return fget(self)
+
+        cached = getattr(self, "_manifest_cache", None)
+        if cached is not None and cached[0] == self._revision():
+            return cached[1]
+
+        self._manifest_building = True
+        try:
+            o = fget(self)
+        finally:
+            self._manifest_building = False
+
+        # taken after the build, which may itself call a mutator
+        self._manifest_cache = (self._revision(), o)
+
+        return o
+
+    return manifest
+
+
+class _ManifestBuilder:
+    """
+    Base of the manifest builders which caches the `manifest` property
+    until the object is changed.
 
+    The `set`, `set_*`, `add_*` and `enable_*` methods of the subclasses
+    bump the object revision, the manifest is rebuilt on the next read.
+    The returned manifest is shared between reads and must be treated
+    as read-only.
+    """
+
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        for name, attr in list(vars(cls).items()):
+            if name == "manifest" and isinstance(attr, property):
+                setattr(cls, name, property(_cached_manifest(attr.fget)))
+            elif callable(attr) and (
+                name == "set" or name.startswith(_MUTATOR_PREFIXES)
+            ):
+                setattr(cls, name, _mutator(attr))
+
+    def _revision(self):
+        return getattr(self, "_rev", 0)
+
+
+# Scaffolding cloned by the builders instead of being constructed (and
+# validated) again for every new object
+_OBJECT_META_TEMPLATE = client.V1ObjectMeta()
+_CONTAINER_TEMPLATE = client.V1Container(name="")
+_POD_SPEC_TEMPLATE = client.V1PodSpec(
+    containers=[],
+    automount_service_account_token=False,
+    enable_service_links=False,
+)
+_POD_TEMPLATE_SPEC_TEMPLATE = client.V1PodTemplateSpec()
+_JOB_TEMPLATE_SPEC_TEMPLATE = client.V1JobTemplateSpec()
+_LABEL_SELECTOR_TEMPLATE = client.V1LabelSelector()
+
+
+class ObjectMetadata(_ManifestBuilder):
+    __slots__ = ()
 
-class ObjectMetadata:
     def __init__(self, name: str):
-        self._metadata = client.V1ObjectMeta(name=name)
+        self._metadata = _clone(_OBJECT_META_TEMPLATE)
+        self._metadata.name = name
 
     def set_namespace(self, namespace: str):
         self._metadata.namespace = namespace
 
-    def set_annotations(self, **kwargs):
-        self._metadata.annotations = dict_str(**kwargs)
+    def set_annotations(self, data: dict[str, str] = None, /, **kwargs):
+        self._metadata.annotations = dict_str_fast(data, kwargs)
 
-    def set_labels(self, **kwargs):
-        self._metadata.labels = dict_str(**kwargs)
+    def set_labels(self, data: dict[str, str] = None, /, **kwargs):
+        self._metadata.labels = dict_str_fast(data, kwargs)
 
     def set_generate_name(self, name: str):
         self._metadata.generate_name = name
@@ -45,10 +172,13 @@ class ObjectMetadata:
         return self._metadata.name
 
 
-class V1Primitive:
+class V1Primitive(_ManifestBuilder):
+    __slots__ = ()
+
     def __init__(self):
-        self._string_data = {}
-        self._binary_data = {}
+        # allocated by the first `_set_*_data`
+        self._string_data: dict[str, str] | None = None
+        self._binary_data: dict[str, str] | None = None
         self._immutable = None
 
     def set_immutable(self, b: bool):
@@ -59,6 +189,9 @@ class V1Primitive:
             self._set_string_data(k, v)
 
     def _set_binary_data(self, k: str, v: typing.Any):
+        if self._binary_data is None:
+            self._binary_data = {}
+
         if isinstance(v, str):
             self._binary_data[k] = self.to_base64(v)
             return
@@ -66,6 +199,9 @@ class V1Primitive:
         self._binary_data[k] = self.to_base64(json.dumps(v))
 
     def _set_string_data(self, k: str, v: typing.Any):
+        if self._string_data is None:
+            self._string_data = {}
+
         if isinstance(v, str):
             self._string_data[k] = v
             return
@@ -77,9 +213,12 @@ class V1Primitive:
         return base64.b64encode(v.encode()).decode()
 
 
-class Container:
+class Container(_ManifestBuilder):
+    __slots__ = ("_c", *_BUILDER_SLOTS)
+
     def __init__(self, name: str):
-        self._c = client.V1Container(name=name)
+        self._c = _clone(_CONTAINER_TEMPLATE)
+        self._c.name = name
 
     @property
     def name(self):
@@ -87,7 +226,7 @@ class Container:
 
     @property
     def manifest(self) -> client.V1Container:
-        return deepcopy(self._c)
+        return _clone(self._c)
 
     def set_command(self, *args):
         self._c.command = list(args)
@@ -101,8 +240,8 @@ class Container:
     def set_working_dir(self, path: str):
         self._c.working_dir = path
 
-    def set_image_pull_policy(self, policy: ImagePullPolicy):
-        self._c.image_pull_policy = policy.value
+    def set_image_pull_policy(self, policy: ImagePullPolicy | str):
+        self._c.image_pull_policy = ImagePullPolicy.plain(policy)
 
     def set_startup_probe(self, probe: client.V1Probe):
         self._c.startup_probe = probe
@@ -203,20 +342,25 @@ class Container:
         self._c.env_from.append(env_from)
 
 
-class PodSpec:
+class PodSpec(_ManifestBuilder):
+    __slots__ = ()
+
     def __init__(self, c: Container):
         self._containers: list[Container] = [c]
         self._init_containers: list[Container] = []
 
-        self._pod_spec = client.V1PodSpec(
-            containers=[],
-            automount_service_account_token=False,
-            enable_service_links=False,
+        self._pod_spec = _clone(_POD_SPEC_TEMPLATE)
+
+    def _revision(self):
+        return (
+            super()._revision(),
+            *(c._revision() for c in self._containers),
+            *(c._revision() for c in self._init_containers),
         )
 
     @property
     def manifest(self) -> client.V1PodSpec:
-        o = deepcopy(self._pod_spec)
+        o = _clone(self._pod_spec)
         o.containers = [c.manifest for c in self._containers]
 
         if self._init_containers:
@@ -295,8 +439,8 @@ class PodSpec:
     def set_hostname(self, host: str):
         self._pod_spec.hostname = host
 
-    def set_node_selector(self, **kwargs):
-        self._pod_spec.node_selector = dict_str(**kwargs)
+    def set_node_selector(self, data: dict[str, str] = None, /, **kwargs):
+        self._pod_spec.node_selector = dict_str_fast(data, kwargs)
 
     def set_service_account_name(self, sa: str):
         self._pod_spec.service_account_name = sa
@@ -390,6 +534,8 @@ class PodSpec:
 
 
 class _TemplateSpec(PodSpec):
+    __slots__ = ()
+
     def __init__(
         self,
         c: Container,
@@ -401,7 +547,7 @@ class _TemplateSpec(PodSpec):
 
     @property
     def manifest(self):
-        o = deepcopy(self._template_spec)
+        o = _clone(self._template_spec)
         o.spec = super().manifest
 
         return o
@@ -410,48 +556,63 @@ class _TemplateSpec(PodSpec):
         if self._template_spec.metadata is None:
             self._template_spec.metadata = client.V1ObjectMeta()
 
-    def set_pod_annotations(self, **kwargs):
+    def set_pod_annotations(self, data: dict[str, str] = None, /, **kwargs):
         self._check_metadata()
-        self._template_spec.metadata.annotations = dict_str(**kwargs)
+        self._template_spec.metadata.annotations = dict_str_fast(data, kwargs)
 
-    def set_pod_labels(self, **kwargs):
+    def set_pod_labels(self, data: dict[str, str] = None, /, **kwargs):
         self._check_metadata()
-        self._template_spec.metadata.labels = dict_str(**kwargs)
+        self._template_spec.metadata.labels = dict_str_fast(data, kwargs)
 
 
 class PodTemplateSpec(_TemplateSpec):
+    __slots__ = ()
+
     def __init__(self, c: Container):
-        super().__init__(c, client.V1PodTemplateSpec())
+        super().__init__(c, _clone(_POD_TEMPLATE_SPEC_TEMPLATE))
 
 
 class JobTemplateSpec(_TemplateSpec):
+    __slots__ = ()
+
     def __init__(self, c: Container):
-        super().__init__(c, client.V1JobTemplateSpec())
+        super().__init__(c, _clone(_JOB_TEMPLATE_SPEC_TEMPLATE))
 
 
-class LabelSelector:
+class _LabelSelector(_ManifestBuilder):
+    __slots__ = ()
+
     def __init__(self):
-        self._selector = client.V1LabelSelector()
+        self._selector = _clone(_LABEL_SELECTOR_TEMPLATE)
+        self._match_expr_index: dict[
+            tuple[str, str], client.V1LabelSelectorRequirement
+        ] = {}
 
     @property
     def manifest(self) -> client.V1LabelSelector:
-        return deepcopy(self._selector)
+        return _clone(self._selector)
 
-    def set_selector_match_labels(self, **kwargs):
-        self._selector.match_labels = dict_str(**kwargs)
+    def set_selector_match_labels(
+        self, data: dict[str, str] = None, /, **kwargs
+    ):
+        self._selector.match_labels = dict_str_fast(data, kwargs)
 
     def add_selector_match_expressions(
-        self, key: str, operator: MatchExprOperator, values: list[str]
+        self, key: str, operator: MatchExprOperator | str, values: list[str]
     ):
-        if self._selector.match_expressions:
-            for e in self._selector.match_expressions:
-                if e.key == key and e.operator == operator.value:
-                    return
-        else:
-            self._selector.match_expression = []
+        operator = MatchExprOperator.plain(operator)
+        if (key, operator) in self._match_expr_index:
+            return
 
-        self._selector.match_expression.append(
-            client.V1LabelSelectorRequirement(
-                key=key, operator=operator.value, values=values
-            )
+        if not self._match_expr_index:
+            self._selector.match_expressions = []
+
+        e = client.V1LabelSelectorRequirement(
+            key=key, operator=operator, values=values
         )
+        self._match_expr_index[key, operator] = e
+        self._selector.match_expressions.append(e)
+
+
+class LabelSelector(_LabelSelector):
+    __slots__ = (*_BUILDER_SLOTS, *_SELECTOR_SLOTS)
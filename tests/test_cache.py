@@ -0,0 +1,110 @@
+import threading
+import time
+import unittest
+from unittest import mock
+
+from kubernetes import client
+from kubernetes.client.rest import ApiException
+
+from kube_ops import api
+from kube_ops.api import KubeApi
+from kube_ops.cache import WatchCache
+
+
+def _pod_list(*names: str) -> client.V1PodList:
+    return client.V1PodList(
+        metadata=client.V1ListMeta(resource_version="1"),
+        items=[
+            client.V1Pod(metadata=client.V1ObjectMeta(name=n)) for n in names
+        ],
+    )
+
+
+class TestWatchCacheSync(unittest.TestCase):
+    def test_snapshot(self):
+        stop = threading.Event()
+
+        def list_pods(*args, **kwargs):
+            if kwargs.get("watch"):
+                stop.wait()
+                raise Exception("closed")
+
+            return _pod_list("a", "b")
+
+        c = WatchCache(list_pods)
+        try:
+            resp = c.snapshot(5)
+        finally:
+            c.stop()
+            stop.set()
+
+        self.assertEqual([p.metadata.name for p in resp.items], ["a", "b"])
+        self.assertEqual(resp.metadata.resource_version, "1")
+
+    def test_snapshot_failed_list(self):
+        def list_pods(*args, **kwargs):
+            raise ApiException(status=403, reason="Forbidden")
+
+        c = WatchCache(list_pods)
+        try:
+            for _ in range(2):
+                start = time.monotonic()
+                self.assertIsNone(c.snapshot(5))
+                self.assertLess(time.monotonic() - start, 1)
+        finally:
+            c.stop()
+
+    def test_list_falls_back_when_cache_list_fails(self):
+        def list_namespaced_pod(namespace, **kwargs):
+            if threading.current_thread().name.startswith("watch-"):
+                raise ApiException(status=403, reason="Forbidden")
+
+            return _pod_list("direct")
+
+        k = KubeApi.__new__(KubeApi)
+        k._ns = "default"
+        k._cache = True
+        k._watch_caches = {}
+        k._watch_caches_lock = threading.Lock()
+        try:
+            for _ in range(2):
+                start = time.monotonic()
+                resp = k._list(list_namespaced_pod, cached=True)
+                self.assertLess(time.monotonic() - start, 1)
+                self.assertEqual(resp.items[0].metadata.name, "direct")
+        finally:
+            for c in k._watch_caches.values():
+                c.stop()
+
+    @mock.patch.object(api, "WATCH_CACHE_MAXSIZE", 2)
+    def test_least_recently_used_cache_is_stopped(self):
+        def list_namespaced_pod(namespace, **kwargs):
+            raise ApiException(status=403, reason="Forbidden")
+
+        k = KubeApi.__new__(KubeApi)
+        k._watch_caches = {}
+        k._watch_caches_lock = threading.Lock()
+        try:
+            args = ("default",)
+            a = k._watch_cache(
+                list_namespaced_pod, args, {"label_selector": "a"}
+            )
+            b = k._watch_cache(
+                list_namespaced_pod, args, {"label_selector": "b"}
+            )
+            # reusing `a` makes `b` the least recently used one
+            k._watch_cache(list_namespaced_pod, args, {"label_selector": "a"})
+            c = k._watch_cache(
+                list_namespaced_pod, args, {"label_selector": "c"}
+            )
+
+            self.assertEqual(list(k._watch_caches.values()), [a, c])
+            self.assertTrue(b._stopped.is_set())
+            self.assertFalse(a._stopped.is_set())
+        finally:
+            for c in k._watch_caches.values():
+                c.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,18 @@
+import unittest
+
+import kube_ops
+
+
+class TestLazyExports(unittest.TestCase):
+    def test_all_matches_lazy_map(self):
+        self.assertEqual(set(kube_ops.__all__), set(kube_ops._LAZY_MAP))
+        self.assertEqual(len(kube_ops.__all__), len(set(kube_ops.__all__)))
+
+    def test_lazy_names_resolve(self):
+        for name, mod in kube_ops._LAZY_MAP.items():
+            obj = getattr(kube_ops, name)
+            self.assertEqual(obj.__module__, f"kube_ops{mod}", name)
+
+
+if __name__ == "__main__":
+    unittest.main()
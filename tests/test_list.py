@@ -0,0 +1,46 @@
+import json
+import unittest
+from unittest import mock
+
+from kube_ops.api import KubeApi
+
+
+class TestIterList(unittest.TestCase):
+    def setUp(self):
+        self.k = KubeApi.__new__(KubeApi)
+        self.k._ns = "default"
+        self.k._cache = False
+
+    def test_pages_are_not_read_from_watch_cache(self):
+        pages = [
+            {"metadata": {"continue": "t1"}, "items": [{"n": 1}]},
+            {"metadata": {}, "items": [{"n": 2}]},
+        ]
+        calls = []
+
+        def list_func(namespace, **kwargs):
+            calls.append(kwargs)
+            return mock.Mock(data=json.dumps(pages[len(calls) - 1]))
+
+        items = list(self.k._iter_list(list_func, limit=1, raw=True))
+
+        self.assertEqual(items, [{"n": 1}, {"n": 2}])
+        self.assertNotIn("resource_version", calls[0])
+        self.assertEqual(calls[0]["limit"], 1)
+        self.assertEqual(calls[1]["_continue"], "t1")
+        self.assertNotIn("resource_version", calls[1])
+
+    def test_explicit_resource_version(self):
+        calls = []
+
+        def list_func(namespace, **kwargs):
+            calls.append(kwargs)
+            return mock.Mock(data='{"metadata": {}, "items": []}')
+
+        list(self.k._iter_list(list_func, raw=True, resource_version="42"))
+
+        self.assertEqual(calls[0]["resource_version"], "42")
+
+
+if __name__ == "__main__":
+    unittest.main()